@@ -160,12 +160,7 @@ class AdvancedBalancer:
         Returns:
             Remote name
         """
-        self.initialize()
-
-        # Filter enabled remotes
-        enabled_remotes = [
-            r for r in self._remote_info.values() if r.enabled and r.free > 0
-        ]
+        enabled_remotes = self._enabled_remotes()
 
         if not enabled_remotes:
             log.warning("No enabled remotes with free space available")
@@ -184,6 +179,36 @@ class AdvancedBalancer:
         else:
             return self._least_used_strategy(enabled_remotes)
 
+    def get_next_remotes(self, count: int) -> List[str]:
+        """
+        Get the next `count` remotes based on current strategy.
+
+        The weighted strategy draws all selections in a single
+        random.choices() call; other strategies repeat get_next_remote().
+
+        Args:
+            count: Number of selections to make
+
+        Returns:
+            List of remote names
+        """
+        if self.strategy != BalancingStrategy.WEIGHTED:
+            return [self.get_next_remote() for _ in range(count)]
+
+        enabled_remotes = self._enabled_remotes()
+
+        if not enabled_remotes:
+            log.warning("No enabled remotes with free space available")
+            return [self.config.remotes[0]] * count
+
+        return self._weighted_choices(enabled_remotes, count)
+
+    def _enabled_remotes(self) -> List[RemoteInfo]:
+        """Get enabled remotes that still have free space."""
+        self.initialize()
+
+        return [r for r in self._remote_info.values() if r.enabled and r.free > 0]
+
     def record_usage(self, remote: str, bytes_added: int):
         """
         Update cached usage after uploading.
@@ -264,6 +289,19 @@ class AdvancedBalancer:
         Returns:
             Remote name
         """
+        return self._weighted_choices(remotes, 1)[0]
+
+    def _weighted_choices(self, remotes: List[RemoteInfo], count: int) -> List[str]:
+        """
+        Make `count` weighted selections among the highest-priority remotes.
+
+        Args:
+            remotes: List of available remotes
+            count: Number of selections to make
+
+        Returns:
+            List of remote names
+        """
         # Sort by priority first
         sorted_remotes = sorted(remotes, key=lambda r: -r.priority)
 
@@ -276,19 +314,15 @@ class AdvancedBalancer:
         # Calculate weighted selection
         total_weight = sum(r.weight for r in priority_remotes)
         if total_weight == 0:
-            return priority_remotes[0].name
+            return [priority_remotes[0].name] * count
 
-        rand_val = random.uniform(0, total_weight)
-        cumulative = 0
-
-        for remote in priority_remotes:
-            cumulative += remote.weight
-            if rand_val <= cumulative:
-                log.debug(f"Weighted strategy selected: {remote.name}")
-                return remote.name
-
-        # Fallback
-        return priority_remotes[0].name
+        selected = random.choices(
+            [r.name for r in priority_remotes],
+            weights=[r.weight for r in priority_remotes],
+            k=count,
+        )
+        log.debug(f"Weighted strategy selected: {', '.join(selected)}")
+        return selected
 
     def _random_strategy(self, remotes: List[RemoteInfo]) -> str:
         """
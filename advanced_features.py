@@ -17,7 +17,7 @@ import time
 import hashlib
 import logging
 import threading
-from typing import Optional, Dict, List, Tuple, Set
+from typing import Optional, Dict, List, Tuple, Set, BinaryIO
 from dataclasses import dataclass
 from enum import Enum
 import base64
@@ -358,14 +358,26 @@ class Deduplicator:
         Returns:
             Hex digest of file hash
         """
+        with open(file_path, "rb") as f:
+            return self.compute_stream_hash(f)
+
+    def compute_stream_hash(self, stream: BinaryIO) -> str:
+        """
+        Compute SHA256 hash of a binary stream.
+
+        Args:
+            stream: Readable binary file-like object
+
+        Returns:
+            Hex digest of stream hash
+        """
         sha256 = hashlib.sha256()
 
-        with open(file_path, "rb") as f:
-            while True:
-                data = f.read(65536)  # 64KB chunks
-                if not data:
-                    break
-                sha256.update(data)
+        while True:
+            data = stream.read(65536)  # 64KB chunks
+            if not data:
+                break
+            sha256.update(data)
 
         return sha256.hexdigest()
 
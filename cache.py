@@ -10,7 +10,9 @@ import json
 import os
 import time
 import logging
-from typing import Optional, Dict, List
+import threading
+from collections import OrderedDict
+from typing import Any, Optional, Dict, List
 from pathlib import Path
 
 log = logging.getLogger("rclonepool")
@@ -359,3 +361,129 @@ class ChunkCache:
     def __del__(self):
         """Cleanup on deletion."""
         self.clear()
+
+
+class TTLCache:
+    """Thread-safe in-memory LRU cache whose entries expire after a fixed TTL."""
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 5.0):
+        """
+        Initialize TTL cache.
+
+        Args:
+            maxsize: Maximum number of entries before the least recently used is evicted
+            ttl: Seconds an entry stays valid after it is stored
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Any, tuple]" = OrderedDict()  # key -> (expires, value)
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        """
+        Get a value if it is present and not expired.
+
+        Args:
+            key: Cache key
+            default: Returned on a miss
+
+        Returns:
+            Cached value or default
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            if entry[0] <= time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return entry[1]
+
+    def put(self, key, value):
+        """
+        Store a value, evicting the least recently used entry if full.
+
+        Args:
+            key: Cache key
+            value: Value to cache (may be None)
+        """
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key, default=None):
+        """Remove an entry and return its value, or default if absent."""
+        with self._lock:
+            entry = self._data.pop(key, None)
+            return default if entry is None else entry[1]
+
+    def clear(self):
+        """Remove all entries."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class BytesLRUCache:
+    """Thread-safe in-memory LRU cache of byte strings bounded by total size."""
+
+    def __init__(self, max_bytes: int):
+        """
+        Initialize bytes cache.
+
+        Args:
+            max_bytes: Total size of cached values before the least recently used are evicted
+        """
+        self.max_bytes = max_bytes
+        self.current_size = 0
+        self._data: "OrderedDict[Any, bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key) -> Optional[bytes]:
+        """Get cached bytes, or None on a miss."""
+        with self._lock:
+            data = self._data.get(key)
+            if data is not None:
+                self._data.move_to_end(key)
+            return data
+
+    def put(self, key, data: bytes):
+        """
+        Store bytes, evicting least recently used entries to make room.
+
+        Values larger than max_bytes are not cached.
+        """
+        size = len(data)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            old = self._data.pop(key, None)
+            if old is not None:
+                self.current_size -= len(old)
+            while self._data and self.current_size + size > self.max_bytes:
+                _, evicted = self._data.popitem(last=False)
+                self.current_size -= len(evicted)
+            self._data[key] = data
+            self.current_size += size
+
+    def pop(self, key) -> Optional[bytes]:
+        """Remove an entry and return its bytes, or None if absent."""
+        with self._lock:
+            data = self._data.pop(key, None)
+            if data is not None:
+                self.current_size -= len(data)
+            return data
+
+    def clear(self):
+        """Remove all entries."""
+        with self._lock:
+            self._data.clear()
+            self.current_size = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
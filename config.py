@@ -23,6 +23,16 @@ DEFAULT_CONFIG = {
     "rclone_flags": ["--fast-list", "--no-traverse"],
     "webdav_port": 8080,
     "webdav_host": "0.0.0.0",
+    "webdav_workers": min(32, (os.cpu_count() or 1) * 4),  # Request handler threads
+    "webdav_timeout": 30.0,  # Seconds a WebDAV client may stay silent before it is dropped
+    "zero_copy_send": True,  # sendfile() chunks to WebDAV clients on full GETs
+    "webdav_cache_ttl": 5.0,  # Seconds WebDAV reuses manifest lookups and listings
+    "stream_uploads": True,  # Chunk WebDAV PUT bodies in flight instead of staging
+    "put_read_size": 8388608,  # 8MB reads when staging a PUT body to temp_dir
+    "max_upload_size": 0,  # Largest WebDAV PUT accepted, in bytes (0 = unlimited)
+    "min_free_disk": 0,  # Bytes kept free in temp_dir when accepting a PUT (0 = no reserve)
+    "low_latency_stream": False,  # Flush each chunk of a full GET as soon as it is written
+    "propfind_chunked": False,  # Stream PROPFIND replies without Content-Length
     # v0.2 - Robustness
     "enable_retry": True,
     "max_retries": 3,
@@ -30,14 +40,20 @@ DEFAULT_CONFIG = {
     "enable_manifest_cache": True,
     "manifest_cache_dir": "~/.cache/rclonepool",
     "enable_duplicate_detection": True,
+    "verify_workers": 8,  # Files verified concurrently by 'verify'
+    "repair_workers": 4,  # Chunks re-uploaded concurrently by 'repair'
+    "orphan_bloom_threshold": 5000000,  # Chunk count above which 'orphans' uses a Bloom filter
     # v0.3 - Performance
     "parallel_uploads": False,
     "parallel_downloads": False,
     "max_parallel_workers": 4,
     "enable_chunk_cache": True,
     "chunk_cache_size_mb": 500,
+    "range_cache_size_mb": 256,  # RAM for whole chunks reused by Range reads (0 = off)
+    "range_cache_max_chunk_mb": 8,  # Larger chunks are read by range, never cached whole
     "enable_prefetch": True,
     "prefetch_chunks": 2,
+    "prefetch_max_mb": 512,  # Chunk bytes WebDAV GETs may download ahead, across all requests
     "enable_rclone_daemon": False,
     "rclone_daemon_port": 5572,
     "show_progress": True,
@@ -137,6 +153,54 @@ class Config:
     def use_crypt(self) -> bool:
         return self._data["use_crypt"]
 
+    @property
+    def webdav_host(self) -> str:
+        return self._data.get("webdav_host", "0.0.0.0")
+
+    @property
+    def webdav_port(self) -> int:
+        return self._data.get("webdav_port", 8080)
+
+    @property
+    def webdav_workers(self) -> int:
+        return self._data.get("webdav_workers", DEFAULT_CONFIG["webdav_workers"])
+
+    @property
+    def webdav_timeout(self) -> float:
+        return self._data.get("webdav_timeout", 30.0)
+
+    @property
+    def zero_copy_send(self) -> bool:
+        return self._data.get("zero_copy_send", True)
+
+    @property
+    def webdav_cache_ttl(self) -> float:
+        return self._data.get("webdav_cache_ttl", 5.0)
+
+    @property
+    def stream_uploads(self) -> bool:
+        return self._data.get("stream_uploads", True)
+
+    @property
+    def put_read_size(self) -> int:
+        return self._data.get("put_read_size", 8388608)
+
+    @property
+    def max_upload_size(self) -> int:
+        return self._data.get("max_upload_size", 0)
+
+    @property
+    def min_free_disk(self) -> int:
+        return self._data.get("min_free_disk", 0)
+
+    @property
+    def low_latency_stream(self) -> bool:
+        return self._data.get("low_latency_stream", False)
+
+    @property
+    def propfind_chunked(self) -> bool:
+        return self._data.get("propfind_chunked", False)
+
     # v0.2 - Robustness properties
     @property
     def enable_retry(self) -> bool:
@@ -156,6 +220,22 @@ class Config:
             self._data.get("manifest_cache_dir", "~/.cache/rclonepool")
         )
 
+    @property
+    def enable_duplicate_detection(self) -> bool:
+        return self._data.get("enable_duplicate_detection", True)
+
+    @property
+    def verify_workers(self) -> int:
+        return self._data.get("verify_workers", 8)
+
+    @property
+    def repair_workers(self) -> int:
+        return self._data.get("repair_workers", 4)
+
+    @property
+    def orphan_bloom_threshold(self) -> int:
+        return self._data.get("orphan_bloom_threshold", 5000000)
+
     # v0.3 - Performance properties
     @property
     def parallel_uploads(self) -> bool:
@@ -169,6 +249,26 @@ class Config:
     def max_parallel_workers(self) -> int:
         return self._data.get("max_parallel_workers", 4)
 
+    @property
+    def range_cache_size_mb(self) -> int:
+        return self._data.get("range_cache_size_mb", 256)
+
+    @property
+    def range_cache_max_chunk_mb(self) -> int:
+        return self._data.get("range_cache_max_chunk_mb", 8)
+
+    @property
+    def enable_prefetch(self) -> bool:
+        return self._data.get("enable_prefetch", True)
+
+    @property
+    def prefetch_chunks(self) -> int:
+        return self._data.get("prefetch_chunks", 2)
+
+    @property
+    def prefetch_max_mb(self) -> int:
+        return self._data.get("prefetch_max_mb", 512)
+
     @property
     def show_progress(self) -> bool:
         return self._data.get("show_progress", True)
@@ -10,16 +10,50 @@ import hashlib
 import time
 import os
 import logging
-from typing import Optional, List
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Optional, List, Dict, Set
 
 log = logging.getLogger('rclonepool')
 
 
+def _chunk_index(chunk: dict) -> int:
+    return chunk.get('index', 0)
+
+
+@dataclass(frozen=True)
+class ManifestSnapshot:
+    """Every manifest at one point in time, indexed for lookups."""
+    version: int = 0
+    by_dir: Dict[str, List[dict]] = field(default_factory=dict)  # remote_dir -> manifests
+    by_path: Dict[str, dict] = field(default_factory=dict)  # file_path -> manifest
+    dirs: Set[str] = field(default_factory=set)  # every directory holding files, with ancestors
+
+
+def _index_chunks(manifest: dict) -> dict:
+    """Sort chunks by index and record their start offsets for bisecting.
+
+    _chunk_offsets is derived data and is never written back to the remotes.
+    Missing fields default to empty/zero so one malformed manifest cannot
+    break a whole listing.
+    """
+    chunks = manifest.setdefault('chunks', [])
+    chunks.sort(key=_chunk_index)
+    manifest['_chunk_offsets'] = [c.get('offset', 0) for c in chunks]
+    return manifest
+
+
 class ManifestManager:
     def __init__(self, config, backend):
         self.config = config
         self.backend = backend
         self._manifest_cache = {}
+        # snapshot() state: manifest name -> (mtime, manifest) and the grouped result
+        self._snapshot_lock = threading.Lock()
+        self._snapshot_entries = {}
+        self._snapshot_listing = None
+        self._snapshot = ManifestSnapshot()
 
     def create_manifest(self, file_name: str, remote_dir: str, file_size: int,
                         chunk_size: int, chunks: list) -> dict:
@@ -47,11 +81,16 @@ class ManifestManager:
             safe_name = 'root'
         return f"{self.config.manifest_prefix}/{safe_name}.manifest.json"
 
+    def _snapshot_name(self, manifest_remote_path: str) -> str:
+        """snapshot() entry key: the manifest path relative to manifest_prefix."""
+        return manifest_remote_path[len(self.config.manifest_prefix) + 1:]
+
     def save_manifest(self, manifest: dict):
         """Save manifest to ALL remotes for redundancy."""
         file_path = manifest['file_path']
         manifest_remote_path = self._manifest_remote_path(file_path)
-        manifest_json = json.dumps(manifest, indent=2)
+        manifest_json = json.dumps(
+            {k: v for k, v in manifest.items() if not k.startswith('_')}, indent=2)
 
         log.info(f"  Saving manifest to all remotes...")
         for remote in self.config.remotes:
@@ -66,7 +105,38 @@ class ManifestManager:
                 log.debug(f"  Manifest saved to {remote}")
 
         # Also cache it locally
-        self._manifest_cache[file_path] = manifest
+        self._manifest_cache[file_path] = _index_chunks(manifest)
+        # lsf mtimes have one-second resolution, so a rewrite within the same
+        # second would look unchanged to snapshot(); swap the entry in directly
+        name = self._snapshot_name(manifest_remote_path)
+        with self._snapshot_lock:
+            entry = self._snapshot_entries.get(name)
+            self._snapshot_entries[name] = (entry[0] if entry else None, manifest)
+            self._snapshot_listing = None
+
+    def rename_manifest(self, src_path: str, dest_path: str) -> Optional[dict]:
+        """Point a file's manifest at a new path; its chunks stay where they are.
+
+        The new manifest is written before the old one is deleted, so a crash in
+        between leaves the file listed twice rather than not at all.
+        Returns the renamed manifest, or None if src_path has no manifest.
+        """
+        manifest = self.load_manifest_for_file(src_path)
+        if not manifest:
+            return None
+
+        dest_dir, _, dest_name = dest_path.rstrip('/').rpartition('/')
+        dest_dir = dest_dir or '/'
+        renamed = dict(manifest,
+                       file_name=dest_name,
+                       remote_dir=dest_dir,
+                       file_path=f"{dest_dir.rstrip('/')}/{dest_name}")
+        self.save_manifest(renamed)
+
+        old_remote_path = self._manifest_remote_path(manifest['file_path'])
+        if self._manifest_remote_path(renamed['file_path']) != old_remote_path:
+            self.delete_manifest(manifest['file_path'])
+        return renamed
 
     def load_manifest_for_file(self, file_path: str) -> Optional[dict]:
         """Load manifest for a file. Tries cache first, then remotes."""
@@ -86,7 +156,7 @@ class ManifestManager:
             try:
                 data = self.backend.download_bytes(remote, manifest_remote_path, suppress_errors=True)
                 if data:
-                    manifest = json.loads(data.decode('utf-8'))
+                    manifest = _index_chunks(json.loads(data.decode('utf-8')))
                     self._manifest_cache[file_path] = manifest
                     log.debug(f"  Loaded manifest from {remote}")
                     return manifest
@@ -97,12 +167,14 @@ class ManifestManager:
         log.warning(f"  No manifest found for {file_path}")
         return None
 
-    def list_manifests(self, remote_dir: str = '/', recursive: bool = False) -> List[dict]:
+    def list_manifests(self, remote_dir: str = '/', recursive: bool = False,
+                       workers: int = 8) -> List[dict]:
         """List all manifests, optionally filtered by directory.
         
         Args:
             remote_dir: Directory to filter by
             recursive: If True, include files in subdirectories as well
+            workers: Maximum number of manifests downloaded concurrently
         """
         remote_dir = remote_dir.rstrip('/') or '/'
         manifests = []
@@ -116,41 +188,37 @@ class ManifestManager:
                 if not files:
                     continue
 
-                for f in files:
-                    if not f.endswith('.manifest.json'):
-                        continue
-                    if f in seen_files:
-                        continue
-                    seen_files.add(f)
-
-                    manifest_path = f"{self.config.manifest_prefix}/{f}"
-                    data = self.backend.download_bytes(remote, manifest_path, suppress_errors=True)
-                    if data:
-                        try:
-                            manifest = json.loads(data.decode('utf-8'))
-                            manifest_dir = manifest.get('remote_dir', '/')
-                            
-                            # Filter logic
-                            if remote_dir == '/':
-                                # At root, include if exact match or if recursive
-                                if manifest_dir == '/' or recursive:
+                names = [f for f in files
+                         if f.endswith('.manifest.json') and f not in seen_files]
+                seen_files.update(names)
+
+                # Manifests are small and latency-bound, so fetch them concurrently
+                with ThreadPoolExecutor(max_workers=max(1, min(workers, len(names)))) as executor:
+                    fetched = list(executor.map(
+                        lambda name: self.download_manifest(remote, name), names))
+
+                for manifest in fetched:
+                    if manifest:
+                        manifest_dir = manifest.get('remote_dir', '/')
+                        
+                        # Filter logic
+                        if remote_dir == '/':
+                            # At root, include if exact match or if recursive
+                            if manifest_dir == '/' or recursive:
+                                manifests.append(manifest)
+                                self._manifest_cache[manifest['file_path']] = manifest
+                        else:
+                            # In a subdirectory
+                            if recursive:
+                                # Include if in this dir or any subdirectory
+                                if manifest_dir == remote_dir or manifest_dir.startswith(remote_dir.rstrip('/') + '/'):
                                     manifests.append(manifest)
                                     self._manifest_cache[manifest['file_path']] = manifest
                             else:
-                                # In a subdirectory
-                                if recursive:
-                                    # Include if in this dir or any subdirectory
-                                    if manifest_dir == remote_dir or manifest_dir.startswith(remote_dir.rstrip('/') + '/'):
-                                        manifests.append(manifest)
-                                        self._manifest_cache[manifest['file_path']] = manifest
-                                else:
-                                    # Include only if exact match
-                                    if manifest_dir == remote_dir:
-                                        manifests.append(manifest)
-                                        self._manifest_cache[manifest['file_path']] = manifest
-                        except json.JSONDecodeError:
-                            log.warning(f"  Corrupt manifest: {manifest_path} on {remote}")
-                            continue
+                                # Include only if exact match
+                                if manifest_dir == remote_dir:
+                                    manifests.append(manifest)
+                                    self._manifest_cache[manifest['file_path']] = manifest
 
                 if manifests:
                     break
@@ -160,6 +228,78 @@ class ManifestManager:
 
         return manifests
 
+    def snapshot(self, workers: int = 8) -> ManifestSnapshot:
+        """Return every manifest grouped by directory and keyed by file path.
+
+        The manifest directory is listed with modification times on each call,
+        but the snapshot is rebuilt only when that listing changes, and then
+        only new or modified manifests are downloaded. version increases
+        whenever the snapshot is rebuilt.
+        """
+        with self._snapshot_lock:
+            listing = None
+            for remote in self.config.remotes:
+                files = self.backend.list_files_with_mtimes(remote, self.config.manifest_prefix)
+                if files:
+                    listing = {name: mtime for name, mtime in files.items()
+                               if name.endswith('.manifest.json')}
+                    break
+                if files is not None:
+                    listing = {}
+
+            if listing is None:
+                # Every remote failed; keep serving what we had
+                return self._snapshot
+            if listing == self._snapshot_listing:
+                return self._snapshot
+
+            entries = self._snapshot_entries
+            stale = [name for name, mtime in listing.items()
+                     if name not in entries or entries[name][0] != mtime]
+            if stale:
+                with ThreadPoolExecutor(max_workers=max(1, min(workers, len(stale)))) as executor:
+                    fetched = list(executor.map(
+                        lambda name: self.download_manifest(remote, name), stale))
+                for name, manifest in zip(stale, fetched):
+                    if manifest:
+                        entries[name] = (listing[name], manifest)
+                    else:
+                        entries.pop(name, None)
+            for name in entries.keys() - listing.keys():
+                del entries[name]
+
+            by_dir = {}
+            by_path = {}
+            for name in listing:
+                if name in entries:
+                    manifest = entries[name][1]
+                    by_dir.setdefault(manifest.get('remote_dir', '/'), []).append(manifest)
+                    by_path['/' + manifest['file_path'].strip('/')] = manifest
+
+            dirs = {'/'}
+            for remote_dir in by_dir:
+                parts = remote_dir.strip('/').split('/')
+                for i in range(1, len(parts) + 1):
+                    dirs.add('/' + '/'.join(parts[:i]))
+
+            # Retry manifests that failed to download on the next call
+            complete = len(entries) == len(listing)
+            self._snapshot_listing = listing if complete else None
+            self._snapshot = ManifestSnapshot(self._snapshot.version + 1, by_dir, by_path, dirs)
+            return self._snapshot
+
+    def download_manifest(self, remote: str, manifest_name: str) -> Optional[dict]:
+        """Download and parse one manifest file from the manifest prefix on a remote."""
+        manifest_path = f"{self.config.manifest_prefix}/{manifest_name}"
+        data = self.backend.download_bytes(remote, manifest_path, suppress_errors=True)
+        if not data:
+            return None
+        try:
+            return _index_chunks(json.loads(data.decode('utf-8')))
+        except json.JSONDecodeError:
+            log.warning(f"  Corrupt manifest: {manifest_path} on {remote}")
+            return None
+
     def delete_manifest(self, file_path: str):
         """Delete manifest from all remotes."""
         file_path = file_path.strip('/')
@@ -177,6 +317,9 @@ class ManifestManager:
 
         # Remove from cache
         self._manifest_cache.pop(file_path, None)
+        with self._snapshot_lock:
+            self._snapshot_entries.pop(self._snapshot_name(manifest_remote_path), None)
+            self._snapshot_listing = None
 
     def rebuild_cache(self):
         """Rebuild local manifest cache from remotes."""
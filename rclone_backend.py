@@ -7,10 +7,12 @@ Handles temp file management using RAM (tmpfs).
 
 import subprocess
 import os
+import json
 import tempfile
 import shutil
 import logging
-from typing import Optional, Tuple, List
+import threading
+from typing import Optional, Tuple, List, Dict
 
 log = logging.getLogger('rclonepool')
 
@@ -58,7 +60,7 @@ class RcloneBackend:
         return result.returncode == 0
 
     def upload_bytes(self, data: bytes, remote: str, remote_path: str) -> bool:
-        """Upload bytes to a remote. Uses temp file in RAM (tmpfs)."""
+        """Upload bytes (or any bytes-like buffer) to a remote. Uses temp file in RAM (tmpfs)."""
         # Write to tmpfs to avoid SSD writes
         temp_path = os.path.join(self.config.temp_dir, f"chunk_{os.getpid()}_{id(data)}.tmp")
         try:
@@ -95,6 +97,29 @@ class RcloneBackend:
             except OSError:
                 pass
 
+    def download_to_tempfile(self, remote: str, remote_path: str):
+        """
+        Download a file from remote into an unlinked temp file in RAM (tmpfs).
+        Returns an open binary file object (caller closes it), or None on error.
+        """
+        temp_path = os.path.join(
+            self.config.temp_dir,
+            f"dlf_{os.getpid()}_{threading.get_ident()}_{hash(remote_path) & 0xFFFFFFFF}.tmp")
+        try:
+            src = f"{remote}{remote_path}"
+            result = self._run(['copyto', src, temp_path] + self.flags)
+
+            if result.returncode != 0 or not os.path.exists(temp_path):
+                return None
+
+            # The open handle keeps the data alive once the name is removed
+            return open(temp_path, 'rb')
+        finally:
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+
     def download_byte_range(self, remote: str, remote_path: str,
                             offset: int, length: int) -> Optional[bytes]:
         """
@@ -131,6 +156,44 @@ class RcloneBackend:
         result = self._run(['deletefile', target])
         return result.returncode == 0
 
+    def delete_files_batch(self, remote: str, remote_paths: List[str]) -> List[str]:
+        """
+        Delete many files from one remote with a single rclone call.
+        Returns the paths that were deleted.
+        """
+        if not remote_paths:
+            return []
+
+        list_path = os.path.join(self.config.temp_dir, f"delete_{os.getpid()}_{id(remote_paths)}.txt")
+        try:
+            with open(list_path, 'w') as f:
+                f.write('\n'.join(remote_paths) + '\n')
+
+            result = self._run(['delete', remote, '--files-from', list_path])
+        finally:
+            try:
+                os.remove(list_path)
+            except OSError:
+                pass
+
+        if result.returncode == 0:
+            return list(remote_paths)
+
+        # Partial failure: list the affected directories to see what is left
+        by_dir = {}
+        for remote_path in remote_paths:
+            parent, _, name = remote_path.rpartition('/')
+            by_dir.setdefault(parent, []).append((remote_path, name))
+
+        deleted = []
+        for parent, entries in by_dir.items():
+            remaining = self.list_files(remote, parent)
+            if remaining is None:
+                continue
+            remaining = set(remaining)
+            deleted.extend(path for path, name in entries if name not in remaining)
+        return deleted
+
     def list_files(self, remote: str, path: str) -> Optional[List[str]]:
         """List files in a remote path. Returns list of filenames."""
         target = f"{remote}{path}"
@@ -148,6 +211,84 @@ class RcloneBackend:
         files = [line.strip() for line in stdout.strip().split('\n') if line.strip()]
         return files
 
+    def list_files_with_sizes(self, remote: str, path: str) -> Optional[Dict[str, int]]:
+        """
+        List files in a remote path with their sizes in one call.
+        Returns {filename: size}, or None on error.
+        """
+        listing = self._list_files_formatted(remote, path, 's')
+        if listing is None:
+            return None
+
+        files = {}
+        for name, size in listing.items():
+            try:
+                files[name] = int(size)
+            except ValueError:
+                log.debug(f"  Unexpected lsf size for {remote}{path}/{name}: {size}")
+        return files
+
+    def list_files_with_mtimes(self, remote: str, path: str) -> Optional[Dict[str, str]]:
+        """
+        List files in a remote path with their modification times in one call.
+        Returns {filename: mtime string}, or None on error.
+        """
+        return self._list_files_formatted(remote, path, 't')
+
+    def _list_files_formatted(self, remote: str, path: str, field: str) -> Optional[Dict[str, str]]:
+        """
+        Run 'lsf --format <field>p' and return {filename: field value}.
+        Returns {} if the directory does not exist yet, None on other errors.
+        """
+        target = f"{remote}{path}"
+        result = self._run(['lsf', target, '--files-only', '--format', f'{field}p',
+                            '--separator', '|'])
+
+        if result.returncode != 0:
+            stderr = result.stderr.decode('utf-8', errors='replace') if result.stderr else ''
+            if 'directory not found' in stderr.lower() or 'not found' in stderr.lower():
+                log.debug(f"  Directory {target} does not exist yet (this is normal)")
+                return {}
+            return None
+
+        files = {}
+        stdout = result.stdout.decode('utf-8', errors='replace')
+        for line in stdout.split('\n'):
+            line = line.strip()
+            if not line:
+                continue
+            # The field comes first, so a '|' inside the file name is harmless
+            value, sep, name = line.partition('|')
+            if not sep:
+                log.debug(f"  Unexpected lsf line for {target}: {line}")
+                continue
+            files[name] = value
+        return files
+
+    def stat(self, remote: str, remote_path: str) -> Optional[dict]:
+        """
+        Get metadata for a single remote file without downloading it.
+
+        Returns the rclone lsjson entry (Path, Name, Size, ...) or None if
+        the file does not exist or cannot be read.
+        """
+        target = f"{remote}{remote_path}"
+        result = self._run(['lsjson', '--stat', '--files-only', '--no-modtime',
+                            '--no-mimetype', target], suppress_errors=True)
+
+        if result.returncode != 0:
+            return None
+
+        try:
+            info = json.loads(result.stdout.decode('utf-8'))
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
+            log.warning(f"  Could not parse stat info for {target}: {e}")
+            return None
+
+        if not isinstance(info, dict) or info.get('IsDir'):
+            return None
+        return info
+
     def list_dirs(self, remote: str, path: str) -> Optional[List[str]]:
         """List directories in a remote path."""
         target = f"{remote}{path}"
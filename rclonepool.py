@@ -9,10 +9,13 @@ Versions: v0.1 (base) through v1.0 (production ready)
 # rclonepool/rclonepool.py
 
 import argparse
+import bisect
+import itertools
 import sys
 import os
 import signal
 import logging
+from concurrent.futures import ThreadPoolExecutor
 
 from config import Config
 from chunker import Chunker
@@ -23,7 +26,7 @@ from webdav_server import RclonePoolDAVServer
 
 # v0.2 - Robustness
 from retry import retry_with_backoff, RetryConfig
-from cache import ManifestCache, ChunkCache
+from cache import ManifestCache, ChunkCache, BytesLRUCache
 from verification import Verifier, DuplicateDetector
 
 # v0.3 - Performance
@@ -72,6 +75,12 @@ class RclonePool:
         # v0.2 - Robustness
         self.manifest_cache = ManifestCache()
         self.chunk_cache = ChunkCache()
+        # Small whole chunks kept in RAM so nearby Range reads skip the backend
+        self.range_cache = BytesLRUCache(self.config.range_cache_size_mb * 1024 * 1024)
+        self._range_cache_max_chunk = min(
+            self.config.range_cache_max_chunk_mb * 1024 * 1024,
+            self.range_cache.max_bytes // 2,
+        )
         self.manifest_mgr = ManifestManager(self.config, self.backend)
         self.verifier = Verifier(self.config, self.backend, self.manifest_mgr)
         self.duplicate_detector = DuplicateDetector(self.manifest_mgr)
@@ -80,6 +89,9 @@ class RclonePool:
         self.parallel_uploader = ParallelUploader(self.backend, max_workers=4)
         self.parallel_downloader = ParallelDownloader(self.backend, max_workers=4)
         self.prefetcher = ChunkPrefetcher(self.backend, self.chunk_cache)
+        self._range_executor = ThreadPoolExecutor(
+            max_workers=self.config.max_parallel_workers, thread_name_prefix="range"
+        )
 
         # v0.4 - Balancing
         self.advanced_balancer = AdvancedBalancer(
@@ -137,6 +149,17 @@ class RclonePool:
             f"Uploading {local_path} ({file_size} bytes) -> {remote_dir}/{file_name}"
         )
 
+        if self.config.enable_duplicate_detection:
+            duplicate = self.duplicate_detector.find_duplicate(
+                file_name, file_size, remote_dir
+            )
+            # Same name and size, and not modified since it was uploaded
+            if duplicate and os.path.getmtime(local_path) <= duplicate.get(
+                "created_at", 0
+            ):
+                log.info(f"  Already uploaded, skipping: {duplicate['file_path']}")
+                return True
+
         # Check if file needs chunking
         chunk_size = self.config.chunk_size
 
@@ -170,6 +193,7 @@ class RclonePool:
                 ],
             )
             self.manifest_mgr.save_manifest(manifest)
+            self.duplicate_detector.invalidate()
             log.info(f"  ✓ Upload complete")
             return True
         else:
@@ -194,7 +218,7 @@ class RclonePool:
                 if not success:
                     log.error(f"  Failed to upload chunk {chunk_index}!")
                     return False
-
+    
                 chunks_info.append(
                     {
                         "index": chunk_index,
@@ -216,9 +240,97 @@ class RclonePool:
                 chunks=chunks_info,
             )
             self.manifest_mgr.save_manifest(manifest)
+            self.duplicate_detector.invalidate()
             log.info(f"  ✓ Upload complete: {len(chunks_info)} chunks across remotes")
             return True
 
+    def upload_stream(self, stream, file_size: int, remote_path: str):
+        """Upload file_size bytes read from a stream, chunking in flight.
+
+        Chunks are read into one reusable buffer and uploaded as they fill, so
+        nothing is staged on disk. The stream must provide readinto().
+        """
+        remote_dir = "/".join(remote_path.rstrip("/").split("/")[:-1]) or "/"
+        file_name = remote_path.rstrip("/").split("/")[-1]
+        chunk_size = self.config.chunk_size
+
+        log.info(f"Uploading stream ({file_size} bytes) -> {remote_dir}/{file_name}")
+
+        buf = bytearray(min(chunk_size, file_size))
+        view = memoryview(buf)
+        chunks_info = []
+        offset = 0
+
+        try:
+            while offset < file_size:
+                chunk_index = len(chunks_info)
+                chunk_len = min(chunk_size, file_size - offset)
+
+                filled = 0
+                while filled < chunk_len:
+                    n = stream.readinto(view[filled:chunk_len])
+                    if not n:
+                        break
+                    filled += n
+                if filled < chunk_len:
+                    log.error(
+                        f"  Stream ended after {offset + filled} of {file_size} bytes"
+                    )
+                    self._delete_uploaded_chunks(chunks_info)
+                    return False
+
+                target_remote = self.balancer.get_least_used_remote()
+                chunk_id = f"{file_name}.chunk.{chunk_index:03d}"
+                chunk_remote_path = f"{self.config.data_prefix}/{chunk_id}"
+
+                log.info(f"  Chunk {chunk_index}: {chunk_len} bytes -> {target_remote}")
+                success = self.backend.upload_bytes(
+                    view[:chunk_len], target_remote, chunk_remote_path
+                )
+                if not success:
+                    log.error(f"  Failed to upload chunk {chunk_index}!")
+                    self._delete_uploaded_chunks(chunks_info)
+                    return False
+    
+                chunks_info.append(
+                    {
+                        "index": chunk_index,
+                        "remote": target_remote,
+                        "path": chunk_remote_path,
+                        "size": chunk_len,
+                        "offset": offset,
+                    }
+                )
+                self.balancer.record_usage(target_remote, chunk_len)
+                offset += chunk_len
+        except OSError as e:
+            # Client timeouts and resets mid-body: nothing will reference these chunks
+            log.error(f"  Upload aborted after {offset} of {file_size} bytes: {e}")
+            self._delete_uploaded_chunks(chunks_info)
+            return False
+        except Exception:
+            self._delete_uploaded_chunks(chunks_info)
+            raise
+        finally:
+            view.release()
+
+        manifest = self.manifest_mgr.create_manifest(
+            file_name=file_name,
+            remote_dir=remote_dir,
+            file_size=file_size,
+            chunk_size=chunk_size,
+            chunks=chunks_info,
+        )
+        self.manifest_mgr.save_manifest(manifest)
+        self.duplicate_detector.invalidate()
+        log.info(f"  ✓ Upload complete: {len(chunks_info)} chunks across remotes")
+        return True
+
+    def _delete_uploaded_chunks(self, chunks_info: list):
+        """Remove the chunks of an upload that could not be completed."""
+        for chunk in chunks_info:
+            self.backend.delete_file(chunk["remote"], chunk["path"])
+
     def download(self, remote_path: str, local_path: str):
         """Download a file, fetching and reassembling chunks."""
         manifest = self.manifest_mgr.load_manifest_for_file(remote_path)
@@ -231,7 +343,7 @@ class RclonePool:
         )
 
         with open(local_path, "wb") as out_f:
-            for chunk in sorted(manifest["chunks"], key=lambda c: c["index"]):
+            for chunk in manifest["chunks"]:
                 log.info(f"  Fetching chunk {chunk['index']} from {chunk['remote']}...")
                 data = self.backend.download_bytes(chunk["remote"], chunk["path"])
                 if data is None:
@@ -248,11 +360,16 @@ class RclonePool:
         if not manifest:
             return None
 
-        result = bytearray()
+        # Work out which part of each covering chunk is needed
+        pieces = []
         remaining = length
         current_offset = offset
 
-        for chunk in sorted(manifest["chunks"], key=lambda c: c["index"]):
+        # Chunks are sorted by index at load; skip straight to the first one needed
+        chunks = manifest["chunks"]
+        first = max(0, bisect.bisect_right(manifest["_chunk_offsets"], offset) - 1)
+
+        for chunk in itertools.islice(chunks, first, None):
             chunk_start = chunk["offset"]
             chunk_end = chunk["offset"] + chunk["size"]
 
@@ -264,21 +381,57 @@ class RclonePool:
             # Calculate what we need from this chunk
             offset_in_chunk = current_offset - chunk_start
             bytes_from_chunk = min(chunk["size"] - offset_in_chunk, remaining)
+            pieces.append((chunk, offset_in_chunk, bytes_from_chunk))
 
-            data = self.backend.download_byte_range(
-                chunk["remote"], chunk["path"], offset_in_chunk, bytes_from_chunk
-            )
-            if data is None:
-                return None
-
-            result.extend(data)
-            remaining -= len(data)
-            current_offset += len(data)
+            remaining -= bytes_from_chunk
+            current_offset += bytes_from_chunk
 
             if remaining <= 0:
                 break
 
-        return bytes(result)
+        # Chunk paths are reused when a file is rewritten, by this process or
+        # another one, so cached bytes are tied to the manifest that listed them
+        version = manifest.get("created_at")
+
+        if self.config.parallel_downloads and len(pieces) > 1:
+            # Ranges spanning several chunks fetch them concurrently
+            futures = [
+                self._range_executor.submit(self._read_chunk_range, *piece, version)
+                for piece in pieces
+            ]
+            parts = [future.result() for future in futures]
+        else:
+            parts = []
+            for piece in pieces:
+                data = self._read_chunk_range(*piece, version)
+                if data is None:
+                    return None
+                parts.append(data)
+
+        if any(data is None for data in parts):
+            return None
+        return b"".join(parts)
+
+    def _read_chunk_range(self, chunk: dict, offset: int, length: int, version=None):
+        """Read part of a chunk, fetching and caching the whole chunk if it is small.
+
+        version identifies the manifest the chunk came from (its created_at).
+        """
+        cache = self.range_cache
+        # Large chunks are read by range: a small seek must not pull a whole chunk
+        if chunk["size"] > self._range_cache_max_chunk:
+            return self.backend.download_byte_range(
+                chunk["remote"], chunk["path"], offset, length
+            )
+
+        key = (chunk["remote"], chunk["path"], version)
+        data = cache.get(key)
+        if data is None:
+            data = self.backend.download_bytes(chunk["remote"], chunk["path"])
+            if data is None:
+                return None
+            cache.put(key, data)
+        return memoryview(data)[offset : offset + length]
 
     def ls(self, remote_dir: str = "/"):
         """List files in the pool."""
@@ -317,8 +470,12 @@ class RclonePool:
         for chunk in manifest["chunks"]:
             log.info(f"  Deleting chunk {chunk['index']} from {chunk['remote']}")
             self.backend.delete_file(chunk["remote"], chunk["path"])
+            self.range_cache.pop(
+                (chunk["remote"], chunk["path"], manifest.get("created_at"))
+            )
 
         self.manifest_mgr.delete_manifest(remote_path)
+        self.duplicate_detector.invalidate()
         log.info(f"  ✓ Deleted")
         return True
 
@@ -7,153 +7,53 @@ Tests all features from v0.1 through v1.0.
 """
 
 import unittest
+import functools
+import importlib
+import io
+import itertools
 import os
 import sys
 import tempfile
-import shutil
+import threading
 import json
 import time
-from unittest.mock import Mock, patch, MagicMock
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from types import SimpleNamespace
+from unittest.mock import Mock, call, patch, MagicMock
 
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from config import Config
-from chunker import Chunker
 from balancer import Balancer
 from manifest import ManifestManager
 from rclone_backend import RcloneBackend
 
 # v0.2 - Robustness
 from retry import retry_with_backoff, RetryConfig, retry_operation
-from cache import ManifestCache, ChunkCache
-from verification import Verifier, DuplicateDetector, VerificationResult
-
-# v0.3 - Performance
-from performance import (
-    ProgressTracker,
-    ParallelUploader,
-    ParallelDownloader,
-    ChunkPrefetcher,
-)
-
-# v0.4 - Balancing
-from advanced_balancer import (
-    AdvancedBalancer,
-    Rebalancer,
-    BalancingStrategy,
-    RemoteInfo,
-)
-
-# v0.5 - Redundancy
-from redundancy import (
-    RedundancyManager,
-    RedundancyMode,
-    ParityConfig,
-    ReedSolomonEncoder,
-)
-
-# v0.6 - Advanced Features
-from advanced_features import (
-    AuthManager,
-    AuthMethod,
-    Deduplicator,
-    Compressor,
-    BandwidthThrottler,
-)
-
-# v1.0 - Production Ready
-from plugin_system import (
-    PluginRegistry,
-    PluginLoader,
-    PluginType,
-    PluginHook,
-    RoundRobinBalancerPlugin,
-)
-
-
-class TestConfig(unittest.TestCase):
-    """Test configuration management."""
+from cache import ManifestCache, ChunkCache, BytesLRUCache
 
-    def setUp(self):
-        self.temp_dir = tempfile.mkdtemp()
-        self.config_path = os.path.join(self.temp_dir, "config.json")
-
-    def tearDown(self):
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
-
-    def test_default_config(self):
-        """Test default configuration values."""
-        config = Config(self.config_path)
-        self.assertEqual(config.chunk_size, 104857600)
-        self.assertEqual(config.data_prefix, "rclonepool_data")
-        self.assertTrue(config.use_crypt)
-
-    def test_config_save_load(self):
-        """Test saving and loading configuration."""
-        config = Config(self.config_path)
-        config._data["remotes"] = ["test1:", "test2:"]
-        config.save()
-
-        config2 = Config(self.config_path)
-        self.assertEqual(config2._data["remotes"], ["test1:", "test2:"])
-
-    def test_config_properties(self):
-        """Test configuration properties."""
-        config = Config(self.config_path)
-        config._data["remotes"] = ["mega1:", "mega2:"]
-        config._data["use_crypt"] = False
-
-        self.assertEqual(config.remotes, ["mega1:", "mega2:"])
-        self.assertEqual(config.base_remotes, ["mega1:", "mega2:"])
-
-
-class TestChunker(unittest.TestCase):
-    """Test file chunking functionality."""
-
-    def setUp(self):
-        self.temp_dir = tempfile.mkdtemp()
-        self.config = Mock()
-        self.config.chunk_size = 1024 * 1024  # 1MB
-        self.chunker = Chunker(self.config)
-
-    def tearDown(self):
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
-
-    def test_chunk_count_calculation(self):
-        """Test chunk count calculation."""
-        count = self.chunker.get_chunk_count(5 * 1024 * 1024, 1024 * 1024)
-        self.assertEqual(count, 5)
-
-        count = self.chunker.get_chunk_count(5.5 * 1024 * 1024, 1024 * 1024)
-        self.assertEqual(count, 6)
-
-    def test_split_file_streaming(self):
-        """Test streaming file split."""
-        test_file = os.path.join(self.temp_dir, "test.bin")
-        test_data = b"A" * (2 * 1024 * 1024 + 512 * 1024)  # 2.5MB
+# v0.3 - v1.0 feature modules are imported by the TestCase classes that use
+# them (see _import_or_skip), so a partial install still runs the core tests.
 
-        with open(test_file, "wb") as f:
-            f.write(test_data)
 
-        chunks = list(self.chunker.split_file_streaming(test_file, 1024 * 1024))
-
-        self.assertEqual(len(chunks), 3)
-        self.assertEqual(chunks[0][0], 0)  # First chunk index
-        self.assertEqual(chunks[0][3], 1024 * 1024)  # First chunk size
-        self.assertEqual(chunks[2][3], 512 * 1024)  # Last chunk size
+def _import_or_skip(module_name: str):
+    """Import a feature module for a TestCase, skipping the class if unavailable."""
+    try:
+        return importlib.import_module(module_name)
+    except ImportError as e:
+        raise unittest.SkipTest(f"{module_name} not available: {e}")
 
 
 class TestManifestCache(unittest.TestCase):
     """Test manifest caching (v0.2)."""
 
     def setUp(self):
-        self.temp_dir = tempfile.mkdtemp()
+        self._tmp = tempfile.TemporaryDirectory(ignore_cleanup_errors=True)
+        self.addCleanup(self._tmp.cleanup)
+        self.temp_dir = self._tmp.name
         self.cache = ManifestCache(self.temp_dir)
 
-    def tearDown(self):
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
-
     def test_cache_put_get(self):
         """Test putting and getting from cache."""
         manifest = {
@@ -168,16 +68,32 @@ class TestManifestCache(unittest.TestCase):
         self.assertEqual(retrieved["file_name"], "test.txt")
         self.assertEqual(retrieved["file_size"], 1000)
 
-    def test_cache_persistence(self):
-        """Test cache persistence across instances."""
+    def test_cache_save_payload(self):
+        """Test the serialized payload written by save()."""
         manifest = {"file_name": "test.txt", "file_path": "/test.txt"}
-
         self.cache.put("/test.txt", manifest)
         self.cache.save()
 
+        with open(self.cache.cache_file) as f:
+            data = json.load(f)
+        self.assertEqual(data["manifests"], {"/test.txt": manifest})
+        self.assertFalse(os.path.exists(self.cache.cache_file + ".tmp"))
+
+    def test_cache_load_payload(self):
+        """Test a new instance rehydrates from a serialized payload."""
+        payload = {
+            "version": 1,
+            "updated_at": 0,
+            "manifests": {
+                "/test.txt": {"file_name": "test.txt", "file_path": "/test.txt"}
+            },
+        }
+        with open(os.path.join(self.temp_dir, "manifest_cache.json"), "w") as f:
+            json.dump(payload, f)
+
         cache2 = ManifestCache(self.temp_dir)
-        retrieved = cache2.get("/test.txt")
 
+        retrieved = cache2.get("/test.txt")
         self.assertIsNotNone(retrieved)
         self.assertEqual(retrieved["file_name"], "test.txt")
 
@@ -196,12 +112,13 @@ class TestChunkCache(unittest.TestCase):
     """Test chunk caching (v0.3)."""
 
     def setUp(self):
-        self.temp_dir = tempfile.mkdtemp()
+        self._tmp = tempfile.TemporaryDirectory(ignore_cleanup_errors=True)
+        self.addCleanup(self._tmp.cleanup)
+        self.temp_dir = self._tmp.name
         self.cache = ChunkCache(max_size_mb=1, cache_dir=self.temp_dir)
 
     def tearDown(self):
         self.cache.clear()
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
 
     def test_chunk_cache_put_get(self):
         """Test caching chunk data."""
@@ -228,6 +145,219 @@ class TestChunkCache(unittest.TestCase):
         self.assertIsNotNone(self.cache.get("chunk3"))
 
 
+class TestBytesLRUCache(unittest.TestCase):
+    """Test the in-memory range cache."""
+
+    def test_evicts_least_recently_used_by_size(self):
+        """Test entries are evicted oldest-use first once max_bytes is exceeded."""
+        cache = BytesLRUCache(max_bytes=10)
+        cache.put("a", b"aaaa")
+        cache.put("b", b"bbbb")
+        cache.get("a")
+        cache.put("c", b"cccc")
+
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a"), b"aaaa")
+        self.assertEqual(cache.current_size, 8)
+
+    def test_oversized_value_not_cached(self):
+        """Test a value larger than the cache is skipped without evicting others."""
+        cache = BytesLRUCache(max_bytes=4)
+        cache.put("a", b"aa")
+        cache.put("big", b"x" * 5)
+
+        self.assertIsNone(cache.get("big"))
+        self.assertEqual(cache.get("a"), b"aa")
+
+
+class TestRangeReads(unittest.TestCase):
+    """Test RclonePool.download_range against the range cache."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.RclonePool = _import_or_skip("rclonepool").RclonePool
+
+    def setUp(self):
+        # Bypass __init__: only the attributes download_range touches
+        self.pool = self.RclonePool.__new__(self.RclonePool)
+        self.pool.config = SimpleNamespace(parallel_downloads=False)
+        self.pool.backend = Mock(spec=RcloneBackend)
+        self.pool.backend.download_bytes.side_effect = lambda remote, path: bytes(
+            self.chunk_size
+        )
+        self.pool.backend.download_byte_range.side_effect = (
+            lambda remote, path, offset, length: bytes(length)
+        )
+        self.pool.manifest_mgr = Mock()
+        self.pool.range_cache = BytesLRUCache(256 * 1024 * 1024)
+        self.pool._range_cache_max_chunk = 8 * 1024 * 1024
+
+    def _serve_file(self, chunk_size: int, created_at: float = 1.0):
+        self.chunk_size = chunk_size
+        self.pool.manifest_mgr.load_manifest_for_file.return_value = {
+            "created_at": created_at,
+            "chunks": [
+                {
+                    "index": 0,
+                    "remote": "r1:",
+                    "path": "f.chunk.000",
+                    "offset": 0,
+                    "size": chunk_size,
+                }
+            ],
+            "_chunk_offsets": [0],
+        }
+
+    def test_small_range_on_large_chunk_reads_by_range(self):
+        """Test a 1-byte Range on a default-sized chunk never fetches it whole."""
+        self._serve_file(100 * 1024 * 1024)
+
+        data = self.pool.download_range("/f", 5, 1)
+
+        self.assertEqual(bytes(data), b"\x00")
+        self.pool.backend.download_bytes.assert_not_called()
+        self.pool.backend.download_byte_range.assert_called_once_with(
+            "r1:", "f.chunk.000", 5, 1
+        )
+
+    def test_small_chunk_cached_across_ranges(self):
+        """Test nearby ranges inside a small chunk cost one whole-chunk download."""
+        self._serve_file(1024 * 1024)
+
+        self.pool.download_range("/f", 0, 10)
+        self.pool.download_range("/f", 10, 10)
+
+        self.pool.backend.download_bytes.assert_called_once_with("r1:", "f.chunk.000")
+        self.pool.backend.download_byte_range.assert_not_called()
+
+    def test_rewritten_file_not_served_from_cache(self):
+        """Test a manifest rewritten elsewhere makes the chunk be fetched again."""
+        self._serve_file(1024 * 1024, created_at=1.0)
+        self.pool.download_range("/f", 0, 10)
+
+        # Same chunk path, new upload by another process
+        self._serve_file(1024 * 1024, created_at=2.0)
+        self.pool.backend.download_bytes.side_effect = lambda remote, path: b"new" * 10
+        data = self.pool.download_range("/f", 0, 3)
+
+        self.assertEqual(bytes(data), b"new")
+        self.assertEqual(self.pool.backend.download_bytes.call_count, 2)
+
+
+class TestUploadStream(unittest.TestCase):
+    """Test RclonePool.upload_stream cleanup."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.RclonePool = _import_or_skip("rclonepool").RclonePool
+
+    def setUp(self):
+        # Bypass __init__: only the attributes upload_stream touches
+        self.pool = self.RclonePool.__new__(self.RclonePool)
+        self.pool.config = SimpleNamespace(
+            chunk_size=4, data_prefix="rclonepool_data", remotes=["r1:"]
+        )
+        self.pool.backend = Mock(spec=RcloneBackend)
+        self.pool.backend.upload_bytes.return_value = True
+        self.pool.balancer = Mock(spec=Balancer)
+        self.pool.balancer.get_least_used_remote.return_value = "r1:"
+        self.pool.manifest_mgr = Mock()
+
+    def test_stream_error_deletes_uploaded_chunks(self):
+        """Test a read timeout mid-body removes chunks already uploaded."""
+        stream = Mock()
+        reads = iter([4])
+
+        def readinto(view):
+            try:
+                n = next(reads)
+            except StopIteration:
+                raise TimeoutError("timed out")
+            view[:n] = b"abcd"
+            return n
+
+        stream.readinto.side_effect = readinto
+
+        self.assertFalse(self.pool.upload_stream(stream, 10, "/f.bin"))
+
+        self.pool.backend.delete_file.assert_called_once_with(
+            "r1:", "rclonepool_data/f.bin.chunk.000"
+        )
+        self.pool.manifest_mgr.save_manifest.assert_not_called()
+
+
+class TestUploadDuplicates(unittest.TestCase):
+    """Test RclonePool.upload skips files that are already uploaded."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.RclonePool = _import_or_skip("rclonepool").RclonePool
+        cls.DuplicateDetector = _import_or_skip("verification").DuplicateDetector
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory(ignore_cleanup_errors=True)
+        self.addCleanup(self._tmp.cleanup)
+        self.local_path = os.path.join(self._tmp.name, "a.bin")
+        with open(self.local_path, "wb") as f:
+            f.write(b"abc")
+
+        # Bypass __init__: only the attributes upload touches
+        self.pool = self.RclonePool.__new__(self.RclonePool)
+        self.pool.config = SimpleNamespace(
+            chunk_size=4,
+            data_prefix="rclonepool_data",
+            remotes=["r1:"],
+            enable_duplicate_detection=True,
+        )
+        self.pool.backend = Mock(spec=RcloneBackend)
+        self.pool.backend.upload_file.return_value = True
+        self.pool.balancer = Mock(spec=Balancer)
+        self.pool.balancer.get_least_used_remote.return_value = "r1:"
+        self.pool.manifest_mgr = Mock()
+        self.pool.duplicate_detector = self.DuplicateDetector(self.pool.manifest_mgr)
+
+    def _existing(self, created_at):
+        manifest = {
+            "file_path": "/dir/a.bin",
+            "file_size": 3,
+            "created_at": created_at,
+        }
+        self.pool.manifest_mgr.list_manifests.return_value = [manifest]
+        self.pool.manifest_mgr.load_manifest_for_file.return_value = manifest
+
+    def test_unchanged_duplicate_is_skipped(self):
+        """Test a same-name, same-size file uploaded after its mtime is skipped."""
+        self._existing(os.path.getmtime(self.local_path) + 1)
+
+        self.assertTrue(self.pool.upload(self.local_path, "/dir/a.bin"))
+
+        self.pool.backend.upload_file.assert_not_called()
+        self.pool.manifest_mgr.save_manifest.assert_not_called()
+
+    def test_modified_duplicate_is_uploaded(self):
+        """Test a file modified after the existing upload is uploaded again."""
+        self._existing(os.path.getmtime(self.local_path) - 1)
+
+        self.assertTrue(self.pool.upload(self.local_path, "/dir/a.bin"))
+
+        self.pool.backend.upload_file.assert_called_once()
+        self.pool.manifest_mgr.save_manifest.assert_called_once()
+        # The new manifest is visible to the next lookup
+        self.pool.manifest_mgr.list_manifests.reset_mock()
+        self.pool.duplicate_detector.find_duplicate("a.bin", 3, "/dir")
+        self.pool.manifest_mgr.list_manifests.assert_called_once()
+
+    def test_detection_disabled_always_uploads(self):
+        """Test enable_duplicate_detection=False never consults the index."""
+        self.pool.config.enable_duplicate_detection = False
+        self._existing(os.path.getmtime(self.local_path) + 1)
+
+        self.assertTrue(self.pool.upload(self.local_path, "/dir/a.bin"))
+
+        self.pool.backend.upload_file.assert_called_once()
+        self.pool.manifest_mgr.list_manifests.assert_not_called()
+
+
 class TestRetry(unittest.TestCase):
     """Test retry logic (v0.2)."""
 
@@ -263,7 +393,8 @@ class TestRetry(unittest.TestCase):
         """Test retry exhaustion."""
         call_count = [0]
 
-        @retry_with_backoff(RetryConfig(max_retries=2, base_delay=0.1))
+        # Zero delays keep the retry loop but skip the real backoff sleeps
+        @retry_with_backoff(RetryConfig(max_retries=2, base_delay=0, max_delay=0))
         def operation():
             call_count[0] += 1
             raise Exception("Permanent failure")
@@ -274,12 +405,337 @@ class TestRetry(unittest.TestCase):
         self.assertEqual(call_count[0], 3)  # Initial + 2 retries
 
 
+class TestVerifier(unittest.TestCase):
+    """Test verification and repair (v0.2)."""
+
+    @classmethod
+    def setUpClass(cls):
+        module = _import_or_skip("verification")
+        cls.BloomFilter = module.BloomFilter
+        cls.OrphanChunk = module.OrphanChunk
+        cls.Verifier = module.Verifier
+
+    def setUp(self):
+        self.config = SimpleNamespace(
+            remotes=["remote1:", "remote2:"],
+            data_prefix="rclonepool_data",
+            manifest_prefix="rclonepool_manifests",
+            verify_workers=4,
+            repair_workers=4,
+            orphan_bloom_threshold=1000,
+            enable_manifest_cache=False,
+        )
+        self.backend = Mock(spec=RcloneBackend)
+        self.backend.list_files_with_sizes.side_effect = lambda remote, prefix: {
+            "remote1:": {"f.chunk.000": 10, "f.chunk.002": 7},
+            "remote2:": {},
+        }[remote]
+        self.manifest = {
+            "file_path": "/f",
+            "chunk_size": 10,
+            "chunks": [
+                {
+                    "index": i,
+                    "remote": "remote1:" if i != 1 else "remote2:",
+                    "path": f"rclonepool_data/f.chunk.{i:03d}",
+                    "size": 10,
+                    "offset": i * 10,
+                }
+                for i in range(3)
+            ],
+        }
+        self.manifest_mgr = Mock()
+        self.manifest_mgr.load_manifest_for_file.return_value = self.manifest
+        self.manifest_mgr.list_manifests.return_value = [self.manifest]
+        self.verifier = self.Verifier(self.config, self.backend, self.manifest_mgr)
+
+    def test_verify_file_lists_each_remote_once(self):
+        """Test quick verify resolves existence from one listing per remote."""
+        result = self.verifier.verify_file("/f", quick=True)
+
+        self.assertEqual(result.status, "missing_chunks")
+        self.assertEqual(list(result.missing_chunks), [1])
+        self.assertEqual(result.verified_chunks, 2)
+        self.assertEqual(self.backend.list_files_with_sizes.call_count, 2)
+        self.backend.download_byte_range.assert_not_called()
+
+    def test_verify_file_checks_size_from_listing(self):
+        """Test full verify checks sizes from the listing, not per-chunk calls."""
+        result = self.verifier.verify_file("/f")
+
+        self.assertEqual(list(result.missing_chunks), [1, 2])
+        self.backend.stat.assert_not_called()
+        self.backend.download_bytes.assert_not_called()
+
+    def test_is_intact_stops_at_first_missing_chunk(self):
+        """Test is_intact answers from the first missing chunk."""
+        self.backend.list_files_with_sizes.side_effect = None
+        self.backend.list_files_with_sizes.return_value = None
+        self.backend.stat.return_value = None
+
+        self.assertFalse(self.verifier.is_intact("/f"))
+        self.assertEqual(self.backend.stat.call_count, 1)
+
+    def test_verify_file_falls_back_to_stat(self):
+        """Test chunks are checked via stat when a remote cannot be listed."""
+        self.backend.list_files_with_sizes.side_effect = None
+        self.backend.list_files_with_sizes.return_value = None
+        self.backend.stat.side_effect = lambda remote, path: (
+            None if path.endswith("001") else {"Size": 10}
+        )
+
+        result = self.verifier.verify_file("/f")
+
+        self.assertEqual(list(result.missing_chunks), [1])
+        self.assertEqual(self.backend.stat.call_count, 3)
+
+    def test_verify_all_reuses_listings(self):
+        """Test listings are fetched once per verify_all batch."""
+        self.manifest_mgr.list_manifests.return_value = [self.manifest] * 3
+
+        results = self.verifier.verify_all(quick=True)
+
+        self.assertEqual(len(results), 3)
+        self.assertEqual(self.backend.list_files_with_sizes.call_count, 2)
+
+    def test_verify_all_with_zero_workers(self):
+        """Test verify_workers=0 falls back to the default pool size."""
+        self.config.verify_workers = 0
+        self.manifest_mgr.list_manifests.return_value = [self.manifest] * 2
+
+        self.assertEqual(len(self.verifier.verify_all(quick=True)), 2)
+
+    def test_find_orphans_shares_listings(self):
+        """Test find_orphans reuses the listings fetched by verify_all."""
+        self.backend.list_files_with_sizes.side_effect = lambda remote, prefix: {
+            "remote1:": {"f.chunk.000": 10, "f.chunk.002": 10, "stale.chunk.000": 3},
+            "remote2:": {"f.chunk.001": 10},
+        }[remote]
+
+        self.verifier.verify_all(quick=True)
+        orphans = self.verifier.find_orphans()
+
+        self.assertEqual(
+            [(o.remote, o.path, o.size) for o in orphans],
+            [("remote1:", "rclonepool_data/stale.chunk.000", 3)],
+        )
+        self.assertEqual(self.backend.list_files_with_sizes.call_count, 2)
+
+    def test_find_orphans_with_bloom_filter(self):
+        """Test find_orphans gives the same answer through the Bloom filter."""
+        self.config.orphan_bloom_threshold = 0
+        self.backend.list_files_with_sizes.side_effect = lambda remote, prefix: {
+            "remote1:": {"f.chunk.000": 10, "f.chunk.002": 10, "stale.chunk.000": 3},
+            "remote2:": {"f.chunk.001": 10, "f.chunk.000": 10},
+        }[remote]
+
+        # Fixed salt keeps the filter's (rare) false positives deterministic
+        seeded = functools.partial(self.BloomFilter, salt=b"\x01" * 16)
+        with patch("verification.BloomFilter", seeded):
+            orphans = self.verifier.find_orphans()
+
+        self.assertEqual(
+            [(o.remote, o.path) for o in orphans],
+            [
+                ("remote1:", "rclonepool_data/stale.chunk.000"),
+                ("remote2:", "rclonepool_data/f.chunk.000"),
+            ],
+        )
+
+    def test_delete_orphans_batches_per_remote(self):
+        """Test orphans are deleted with one batch call per remote."""
+        orphans = [
+            self.OrphanChunk("remote1:", "rclonepool_data/a.chunk.000", 1),
+            self.OrphanChunk("remote2:", "rclonepool_data/b.chunk.000", 1),
+            self.OrphanChunk("remote1:", "rclonepool_data/c.chunk.000", 1),
+        ]
+        self.backend.delete_files_batch.side_effect = lambda remote, paths: paths[:1]
+
+        deleted = self.verifier.delete_orphans(orphans, confirm=False)
+
+        self.assertEqual(deleted, 2)
+        self.assertEqual(
+            self.backend.delete_files_batch.call_args_list,
+            [
+                call(
+                    "remote1:",
+                    ["rclonepool_data/a.chunk.000", "rclonepool_data/c.chunk.000"],
+                ),
+                call("remote2:", ["rclonepool_data/b.chunk.000"]),
+            ],
+        )
+        self.backend.delete_file.assert_not_called()
+
+    def test_manifest_index_skips_unchanged_manifests(self):
+        """Test later runs only download manifests whose mtime changed."""
+        tmp = tempfile.TemporaryDirectory(ignore_cleanup_errors=True)
+        self.addCleanup(tmp.cleanup)
+        self.config.enable_manifest_cache = True
+        self.config.manifest_cache_dir = tmp.name
+        mtimes = {"f.manifest.json": "2024-01-01 00:00:00"}
+        self.backend.list_files_with_mtimes.side_effect = lambda remote, prefix: (
+            dict(mtimes) if remote == "remote1:" else {}
+        )
+        self.manifest_mgr.download_manifest.return_value = self.manifest
+
+        self.verifier.verify_all(quick=True)
+        fresh = self.Verifier(self.config, self.backend, self.manifest_mgr)
+        fresh.verify_all(quick=True)
+        self.assertEqual(self.manifest_mgr.download_manifest.call_count, 1)
+
+        mtimes["f.manifest.json"] = "2024-01-02 00:00:00"
+        fresh = self.Verifier(self.config, self.backend, self.manifest_mgr)
+        results = fresh.verify_all(quick=True)
+        self.assertEqual(self.manifest_mgr.download_manifest.call_count, 2)
+        self.assertEqual([r.file_path for r in results], ["/f"])
+        self.manifest_mgr.list_manifests.assert_not_called()
+
+    def test_repair_file_reads_source_once_in_offset_order(self):
+        """Test repair opens the local source once and reads chunks in order."""
+        # A single worker keeps upload calls in read order
+        self.config.repair_workers = 1
+        with tempfile.TemporaryDirectory(ignore_cleanup_errors=True) as tmp:
+            source = os.path.join(tmp, "f")
+            with open(source, "wb") as f:
+                f.write(bytes(range(30)))
+            listings = {"remote1:": {"f.chunk.000": 10}, "remote2:": {}}
+            self.backend.list_files_with_sizes.side_effect = (
+                lambda remote, prefix: dict(listings[remote])
+            )
+            uploaded = []
+
+            def upload(data, remote, path):
+                # Chunks are views of the mapped source, only valid during the call
+                uploaded.append((path, bytes(data)))
+                listings[remote][os.path.basename(path)] = len(data)
+                return True
+
+            self.backend.upload_bytes.side_effect = upload
+
+            with patch("verification.open", wraps=open, create=True) as opened:
+                self.assertTrue(self.verifier.repair_file("/f", source))
+
+        opened.assert_called_once_with(source, "rb")
+        self.assertEqual(
+            uploaded,
+            [
+                ("rclonepool_data/f.chunk.001", bytes(range(10, 20))),
+                ("rclonepool_data/f.chunk.002", bytes(range(20, 30))),
+            ],
+        )
+
+    def test_repair_file_rechecks_only_repaired_chunks(self):
+        """Test the post-repair check only lists remotes holding repaired chunks."""
+        with tempfile.TemporaryDirectory(ignore_cleanup_errors=True) as tmp:
+            source = os.path.join(tmp, "f")
+            with open(source, "wb") as f:
+                f.write(bytes(30))
+            listings = {
+                "remote1:": {"f.chunk.000": 10, "f.chunk.002": 10},
+                "remote2:": {},
+            }
+            self.backend.list_files_with_sizes.side_effect = (
+                lambda remote, prefix: dict(listings[remote])
+            )
+
+            def upload(data, remote, path):
+                listings[remote][os.path.basename(path)] = len(data)
+                return True
+
+            self.backend.upload_bytes.side_effect = upload
+
+            self.assertTrue(self.verifier.repair_file("/f", source))
+
+        self.assertEqual(
+            [c.args[0] for c in self.backend.list_files_with_sizes.call_args_list],
+            ["remote1:", "remote2:", "remote2:"],
+        )
+
+    def test_repair_file_uploads_concurrently(self):
+        """Test missing chunks are re-uploaded in parallel."""
+        with tempfile.TemporaryDirectory(ignore_cleanup_errors=True) as tmp:
+            source = os.path.join(tmp, "f")
+            with open(source, "wb") as f:
+                f.write(bytes(30))
+
+            # Both uploads must be in flight at once to pass the barrier
+            barrier = threading.Barrier(2, timeout=5)
+            self.backend.upload_bytes.side_effect = lambda *args: barrier.wait() >= 0
+
+            self.verifier.repair_file("/f", source)
+
+        self.assertEqual(self.backend.upload_bytes.call_count, 2)
+        self.assertFalse(barrier.broken)
+
+    def test_repair_file_error_not_masked_by_mapping(self):
+        """Test an error mid-repair propagates instead of a BufferError on unmap."""
+        self.config.repair_workers = 1
+        self.backend.upload_bytes.return_value = True
+        with tempfile.TemporaryDirectory(ignore_cleanup_errors=True) as tmp:
+            source = os.path.join(tmp, "f")
+            with open(source, "wb") as f:
+                f.write(bytes(30))
+
+            with patch.object(
+                self.verifier,
+                "_collect_repair_uploads",
+                side_effect=RuntimeError("collect failed"),
+            ):
+                with self.assertRaisesRegex(RuntimeError, "collect failed"):
+                    self.verifier.repair_file("/f", source)
+
+
+class TestDuplicateDetector(unittest.TestCase):
+    """Test duplicate detection (v0.2)."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.DuplicateDetector = _import_or_skip("verification").DuplicateDetector
+
+    def setUp(self):
+        self.manifest = {"file_path": "/dir/a.bin", "file_size": 100}
+        self.manifest_mgr = Mock()
+        self.manifest_mgr.list_manifests.return_value = [self.manifest]
+        self.manifest_mgr.load_manifest_for_file.return_value = self.manifest
+        self.detector = self.DuplicateDetector(self.manifest_mgr)
+
+    def test_find_duplicate_uses_index(self):
+        """Test lookups list manifests once and only load on an index hit."""
+        self.assertIsNone(self.detector.find_duplicate("a.bin", 99, "/dir"))
+        self.assertIsNone(self.detector.find_duplicate("b.bin", 100, "/dir"))
+        self.manifest_mgr.load_manifest_for_file.assert_not_called()
+
+        self.assertIs(self.detector.find_duplicate("a.bin", 100, "/dir"), self.manifest)
+        self.manifest_mgr.load_manifest_for_file.assert_called_once_with("/dir/a.bin")
+        self.assertEqual(self.manifest_mgr.list_manifests.call_count, 1)
+
+    def test_invalidate_rebuilds_index(self):
+        """Test invalidate makes the next lookup see new manifests."""
+        self.assertIsNone(self.detector.find_duplicate("b.bin", 5, "/"))
+        self.manifest_mgr.list_manifests.return_value = [
+            {"file_path": "/b.bin", "file_size": 5}
+        ]
+
+        self.detector.invalidate()
+        self.detector.find_duplicate("b.bin", 5, "/")
+
+        self.assertEqual(self.manifest_mgr.list_manifests.call_count, 2)
+        self.manifest_mgr.load_manifest_for_file.assert_called_once_with("/b.bin")
+
+
 class TestProgressTracker(unittest.TestCase):
     """Test progress tracking (v0.3)."""
 
+    @classmethod
+    def setUpClass(cls):
+        module = _import_or_skip("performance")
+        cls.ProgressTracker = module.ProgressTracker
+
     def test_progress_calculation(self):
         """Test progress percentage calculation."""
-        tracker = ProgressTracker(total_bytes=1000, total_items=10, show_progress=False)
+        tracker = self.ProgressTracker(
+            total_bytes=1000, total_items=10, show_progress=False
+        )
 
         tracker.update(bytes_delta=500, items_delta=5)
         self.assertEqual(tracker.info.percent, 50.0)
@@ -287,32 +743,41 @@ class TestProgressTracker(unittest.TestCase):
 
     def test_progress_speed_calculation(self):
         """Test speed calculation."""
-        tracker = ProgressTracker(
-            total_bytes=1000000, total_items=10, show_progress=False
-        )
-
-        time.sleep(0.1)
-        tracker.update(bytes_delta=100000)
+        # Patch the module-local clock: construct at t=0, update/read at t=0.1
+        with patch("performance.time") as clock:
+            clock.time.side_effect = itertools.chain([0.0], itertools.repeat(0.1))
+            tracker = self.ProgressTracker(
+                total_bytes=1000000, total_items=10, show_progress=False
+            )
+            tracker.update(bytes_delta=100000)
 
-        self.assertGreater(tracker.info.speed_mbps, 0)
+            self.assertGreater(tracker.info.speed_mbps, 0)
 
 
 class TestAdvancedBalancer(unittest.TestCase):
     """Test advanced balancing strategies (v0.4)."""
 
+    @classmethod
+    def setUpClass(cls):
+        module = _import_or_skip("advanced_balancer")
+        cls.AdvancedBalancer = module.AdvancedBalancer
+        cls.BalancingStrategy = module.BalancingStrategy
+
     def setUp(self):
-        self.config = Mock()
-        self.config.remotes = ["remote1:", "remote2:", "remote3:"]
+        self.config = SimpleNamespace(remotes=["remote1:", "remote2:", "remote3:"])
         self.backend = Mock()
+        # Cycle so repeated initialize()/get_usage_report() calls never exhaust
         self.backend.get_space = Mock(
-            side_effect=[
-                (1000, 9000, 10000),  # remote1: 10% used
-                (5000, 5000, 10000),  # remote2: 50% used
-                (8000, 2000, 10000),  # remote3: 80% used
-            ]
+            side_effect=itertools.cycle(
+                [
+                    (1000, 9000, 10000),  # remote1: 10% used
+                    (5000, 5000, 10000),  # remote2: 50% used
+                    (8000, 2000, 10000),  # remote3: 80% used
+                ]
+            )
         )
-        self.balancer = AdvancedBalancer(
-            self.config, self.backend, BalancingStrategy.LEAST_USED
+        self.balancer = self.AdvancedBalancer(
+            self.config, self.backend, self.BalancingStrategy.LEAST_USED
         )
 
     def test_least_used_strategy(self):
@@ -323,7 +788,7 @@ class TestAdvancedBalancer(unittest.TestCase):
 
     def test_round_robin_strategy(self):
         """Test round-robin balancing strategy."""
-        self.balancer.set_strategy(BalancingStrategy.ROUND_ROBIN)
+        self.balancer.set_strategy(self.BalancingStrategy.ROUND_ROBIN)
         self.balancer.initialize()
 
         remote1 = self.balancer.get_next_remote()
@@ -335,41 +800,40 @@ class TestAdvancedBalancer(unittest.TestCase):
 
     def test_weighted_strategy(self):
         """Test weighted balancing strategy."""
-        self.balancer.set_strategy(BalancingStrategy.WEIGHTED)
+        self.balancer.set_strategy(self.BalancingStrategy.WEIGHTED)
         self.balancer.set_remote_weight("remote1:", 2.0)
         self.balancer.set_remote_weight("remote2:", 1.0)
         self.balancer.set_remote_weight("remote3:", 0.5)
         self.balancer.initialize()
 
         # remote1 should be selected more often due to higher weight
-        selections = {}
-        for _ in range(100):
-            remote = self.balancer.get_next_remote()
-            selections[remote] = selections.get(remote, 0) + 1
+        selections = Counter(self.balancer.get_next_remotes(100))
 
         # remote1 should have more selections (not strict due to randomness)
-        self.assertGreater(selections.get("remote1:", 0), 20)
+        self.assertGreater(selections["remote1:"], 20)
 
 
 class TestReedSolomonEncoder(unittest.TestCase):
     """Test Reed-Solomon encoding (v0.5)."""
 
+    @classmethod
+    def setUpClass(cls):
+        module = _import_or_skip("redundancy")
+        # encode/decode are pure, so one encoder is shared by all tests
+        cls.encoder = module.ReedSolomonEncoder(data_shards=3, parity_shards=1)
+
     def test_parity_generation(self):
         """Test parity chunk generation."""
-        encoder = ReedSolomonEncoder(data_shards=3, parity_shards=1)
-
         data_chunks = [b"AAAA", b"BBBB", b"CCCC"]
-        parity_chunks = encoder.encode(data_chunks)
+        parity_chunks = self.encoder.encode(data_chunks)
 
         self.assertEqual(len(parity_chunks), 1)
         self.assertIsInstance(parity_chunks[0], bytes)
 
     def test_reconstruction(self):
         """Test data reconstruction from parity."""
-        encoder = ReedSolomonEncoder(data_shards=3, parity_shards=1)
-
         data_chunks = [b"AAAA", b"BBBB", b"CCCC"]
-        parity_chunks = encoder.encode(data_chunks)
+        parity_chunks = self.encoder.encode(data_chunks)
 
         # Simulate missing chunk
         available = [data_chunks[0], data_chunks[1], None]
@@ -378,7 +842,7 @@ class TestReedSolomonEncoder(unittest.TestCase):
         # Note: Simplified implementation may not fully reconstruct
         # This test validates the interface
         try:
-            reconstructed = encoder.decode(available, [0, 1, 2, 3])
+            reconstructed = self.encoder.decode(available, [0, 1, 2, 3])
             self.assertEqual(len(reconstructed), 4)
         except Exception:
             pass  # Simplified implementation
@@ -387,8 +851,14 @@ class TestReedSolomonEncoder(unittest.TestCase):
 class TestAuthManager(unittest.TestCase):
     """Test authentication manager (v0.6)."""
 
+    @classmethod
+    def setUpClass(cls):
+        module = _import_or_skip("advanced_features")
+        cls.AuthManager = module.AuthManager
+        cls.AuthMethod = module.AuthMethod
+
     def setUp(self):
-        self.auth_mgr = AuthManager(AuthMethod.BASIC)
+        self.auth_mgr = self.AuthManager(self.AuthMethod.BASIC)
 
     def test_add_user(self):
         """Test adding a user."""
@@ -420,26 +890,23 @@ class TestAuthManager(unittest.TestCase):
 class TestDeduplicator(unittest.TestCase):
     """Test deduplication (v0.6)."""
 
+    @classmethod
+    def setUpClass(cls):
+        module = _import_or_skip("advanced_features")
+        cls.Deduplicator = module.Deduplicator
+
     def setUp(self):
         self.manifest_mgr = Mock()
         self.manifest_mgr.list_manifests = Mock(return_value=[])
-        self.dedup = Deduplicator(self.manifest_mgr)
+        self.dedup = self.Deduplicator(self.manifest_mgr)
 
     def test_compute_file_hash(self):
-        """Test file hash computation."""
-        temp_dir = tempfile.mkdtemp()
-        try:
-            test_file = os.path.join(temp_dir, "test.txt")
-            with open(test_file, "w") as f:
-                f.write("test content")
+        """Test content hash computation."""
+        hash1 = self.dedup.compute_stream_hash(io.BytesIO(b"test content"))
+        hash2 = self.dedup.compute_stream_hash(io.BytesIO(b"test content"))
 
-            hash1 = self.dedup.compute_file_hash(test_file)
-            hash2 = self.dedup.compute_file_hash(test_file)
-
-            self.assertEqual(hash1, hash2)
-            self.assertEqual(len(hash1), 64)  # SHA256 hex digest
-        finally:
-            shutil.rmtree(temp_dir)
+        self.assertEqual(hash1, hash2)
+        self.assertEqual(len(hash1), 64)  # SHA256 hex digest
 
     def test_find_duplicate(self):
         """Test duplicate detection."""
@@ -456,46 +923,58 @@ class TestDeduplicator(unittest.TestCase):
 class TestPluginSystem(unittest.TestCase):
     """Test plugin system (v1.0)."""
 
+    @classmethod
+    def setUpClass(cls):
+        module = _import_or_skip("plugin_system")
+        cls.PluginRegistry = module.PluginRegistry
+        cls.PluginType = module.PluginType
+        cls.RoundRobinBalancerPlugin = module.RoundRobinBalancerPlugin
+
     def setUp(self):
-        self.registry = PluginRegistry()
+        self.registry = self.PluginRegistry()
 
     def test_register_plugin(self):
         """Test plugin registration."""
-        plugin = RoundRobinBalancerPlugin()
+        plugin = self.RoundRobinBalancerPlugin()
         success = self.registry.register(plugin)
 
         self.assertTrue(success)
 
     def test_get_plugins_by_type(self):
         """Test getting plugins by type."""
-        plugin = RoundRobinBalancerPlugin()
+        plugin = self.RoundRobinBalancerPlugin()
         self.registry.register(plugin)
 
-        plugins = self.registry.get_plugins_by_type(PluginType.BALANCER)
+        plugins = self.registry.get_plugins_by_type(self.PluginType.BALANCER)
         self.assertEqual(len(plugins), 1)
 
     def test_enable_disable_plugin(self):
         """Test enabling and disabling plugins."""
-        plugin = RoundRobinBalancerPlugin()
+        plugin = self.RoundRobinBalancerPlugin()
         self.registry.register(plugin)
 
         plugin_id = "balancer:round_robin_balancer"
         self.registry.disable_plugin(plugin_id)
 
-        plugins = self.registry.get_plugins_by_type(PluginType.BALANCER)
+        plugins = self.registry.get_plugins_by_type(self.PluginType.BALANCER)
         self.assertEqual(len(plugins), 0)
 
         self.registry.enable_plugin(plugin_id)
-        plugins = self.registry.get_plugins_by_type(PluginType.BALANCER)
+        plugins = self.registry.get_plugins_by_type(self.PluginType.BALANCER)
         self.assertEqual(len(plugins), 1)
 
 
 class TestBandwidthThrottler(unittest.TestCase):
     """Test bandwidth throttling (v0.6)."""
 
+    @classmethod
+    def setUpClass(cls):
+        module = _import_or_skip("advanced_features")
+        cls.BandwidthThrottler = module.BandwidthThrottler
+
     def test_throttle_upload(self):
         """Test upload throttling."""
-        throttler = BandwidthThrottler(max_upload_mbps=1.0)
+        throttler = self.BandwidthThrottler(max_upload_mbps=1.0)
 
         start_time = time.time()
         throttler.throttle_upload(500 * 1024)  # 500KB
@@ -506,7 +985,7 @@ class TestBandwidthThrottler(unittest.TestCase):
 
     def test_no_throttle_when_unlimited(self):
         """Test no throttling when unlimited."""
-        throttler = BandwidthThrottler(max_upload_mbps=0)
+        throttler = self.BandwidthThrottler(max_upload_mbps=0)
 
         start_time = time.time()
         throttler.throttle_upload(1024 * 1024)  # 1MB
@@ -520,10 +999,9 @@ class TestIntegration(unittest.TestCase):
     """Integration tests for complete workflows."""
 
     def setUp(self):
-        self.temp_dir = tempfile.mkdtemp()
-
-    def tearDown(self):
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
+        self._tmp = tempfile.TemporaryDirectory(ignore_cleanup_errors=True)
+        self.addCleanup(self._tmp.cleanup)
+        self.temp_dir = self._tmp.name
 
     def test_upload_download_workflow(self):
         """Test complete upload and download workflow."""
@@ -538,13 +1016,50 @@ class TestIntegration(unittest.TestCase):
         pass
 
 
+def _run_test_ids(test_ids: list):
+    """Run the named tests in this (worker) process; return (output, run, ok)."""
+    loader = unittest.TestLoader()
+    stream = io.StringIO()
+    runner = unittest.TextTestRunner(stream=stream, verbosity=2)
+    result = runner.run(loader.loadTestsFromNames(test_ids))
+    return stream.getvalue(), result.testsRun, result.wasSuccessful()
+
+
 def run_tests():
-    """Run all tests."""
+    """
+    Run all tests: the feature tests in this module plus the unit and
+    integration tests under tests/ (config, chunker, balancer, manifest).
+
+    Several classes patch module globals (open, os.urandom, time), so each
+    TestCase class runs in its own worker process rather than a thread.
+    Output is buffered per class and printed in order once everything has
+    finished.
+    """
+    root = os.path.dirname(os.path.abspath(__file__))
     loader = unittest.TestLoader()
-    suite = loader.loadTestsFromModule(sys.modules[__name__])
-    runner = unittest.TextTestRunner(verbosity=2)
-    result = runner.run(suite)
-    return result.wasSuccessful()
+    loader.sortTestMethodsUsing = None  # dir() order is already alphabetical
+    class_suites = list(loader.loadTestsFromModule(sys.modules[__name__]))
+    for module_suite in loader.discover(
+        os.path.join(root, "tests"), pattern="test_*.py", top_level_dir=root
+    ):
+        class_suites.extend(module_suite)
+    class_ids = [[test.id() for test in suite] for suite in class_suites]
+    class_ids = [ids for ids in class_ids if ids]
+
+    workers = min(len(class_ids), os.cpu_count() or 1) or 1
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        outcomes = list(executor.map(_run_test_ids, class_ids))
+
+    tests_run = 0
+    success = True
+    for output, run, ok in outcomes:
+        sys.stderr.write(output)
+        tests_run += run
+        success = success and ok
+
+    sys.stderr.write(f"\nRan {tests_run} tests in {len(outcomes)} classes: ")
+    sys.stderr.write("OK\n" if success else "FAILED\n")
+    return success
 
 
 if __name__ == "__main__":
@@ -2,17 +2,30 @@
 Tests for balancer.py
 """
 import unittest
+from unittest.mock import Mock
 from balancer import Balancer
 from config import Config
+from rclone_backend import RcloneBackend
 import tempfile
 import json
 import os
 
 
 class TestBalancer(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # Mock RcloneBackend, shared by all tests (no call-count assertions)
+        cls.mock_backend = Mock(spec=RcloneBackend)
+        # get_space returns (used, free, total)
+        cls.mock_backend.get_space.return_value = (
+            1_000_000_000, 19_000_000_000, 20_000_000_000
+        )
+
     def setUp(self):
         # Create a temporary config
-        self.config_dir = tempfile.mkdtemp()
+        self._tmp = tempfile.TemporaryDirectory(ignore_cleanup_errors=True)
+        self.addCleanup(self._tmp.cleanup)
+        self.config_dir = self._tmp.name
         self.config_file = os.path.join(self.config_dir, 'config.json')
         
         config_data = {
@@ -33,18 +46,13 @@ class TestBalancer(unittest.TestCase):
         
         self.config = Config(self.config_file)
         
-        # Mock RcloneBackend
-        self.mock_backend = MockRcloneBackend()
         self.balancer = Balancer(self.config, self.mock_backend)
 
-    def tearDown(self):
-        import shutil
-        shutil.rmtree(self.config_dir, ignore_errors=True)
-
     def test_get_least_used_remote(self):
         """Test getting the remote with least usage"""
         # Manually set usage
-        self.balancer._usage = {
+        self.balancer._initialized = True
+        self.balancer._usage_cache = {
             'test1:': 1000000000,  # 1GB
             'test2:': 500000000,   # 500MB (least)
             'test3:': 2000000000   # 2GB
@@ -55,10 +63,11 @@ class TestBalancer(unittest.TestCase):
 
     def test_record_usage(self):
         """Test recording usage updates"""
-        initial_usage = self.balancer._usage.get('test1:', 0)
+        self.balancer.get_least_used_remote()  # Populate the usage cache
+        initial_usage = self.balancer._usage_cache.get('test1:', 0)
         self.balancer.record_usage('test1:', 100000000)  # 100MB
         
-        new_usage = self.balancer._usage.get('test1:', 0)
+        new_usage = self.balancer._usage_cache.get('test1:', 0)
         self.assertEqual(new_usage, initial_usage + 100000000)
 
     def test_get_usage_report(self):
@@ -69,24 +78,13 @@ class TestBalancer(unittest.TestCase):
         self.assertEqual(len(report), 3)
         
         # Check structure
-        for entry in report:
-            self.assertIn('remote', entry)
+        for remote, entry in report.items():
+            self.assertIn(remote, self.config.remotes)
             self.assertIn('used', entry)
             self.assertIn('total', entry)
             self.assertIn('free', entry)
             self.assertIn('percent', entry)
 
 
-class MockRcloneBackend:
-    """Mock backend for testing"""
-    def get_space(self, remote):
-        # Return mock space data
-        return {
-            'used': 1000000000,
-            'total': 20000000000,
-            'free': 19000000000
-        }
-
-
 if __name__ == '__main__':
     unittest.main()
@@ -4,34 +4,34 @@ Tests for chunker.py
 import unittest
 import tempfile
 import os
-import json
+from types import SimpleNamespace
 from chunker import Chunker
-from config import Config
 
 
 class TestChunker(unittest.TestCase):
-    def setUp(self):
-        # Create a temporary config
-        self.config_dir = tempfile.mkdtemp()
-        self.config_file = os.path.join(self.config_dir, 'config.json')
-        
-        config_data = {
-            "remotes": ["test1:"],
-            "chunk_size": 104857600,
-            "use_crypt": False,
-        }
-        
-        with open(self.config_file, 'w') as f:
-            json.dump(config_data, f)
-        
-        self.config = Config(self.config_file)
-        self.chunker = Chunker(self.config)
-        self.temp_dir = tempfile.mkdtemp()
+    @classmethod
+    def setUpClass(cls):
+        # Sample files shared read-only by the split tests
+        cls._shared_dir = tempfile.mkdtemp()
+        cls._file_1mb = os.path.join(cls._shared_dir, 'test_1mb.bin')
+        with open(cls._file_1mb, 'wb') as f:
+            f.write(os.urandom(1024 * 1024))  # 1MB
+        cls._file_1mb_plus = os.path.join(cls._shared_dir, 'test_1mb_plus.bin')
+        with open(cls._file_1mb_plus, 'wb') as f:
+            f.write(os.urandom(1024 * 1024 + 100))  # 1MB + 100 bytes
 
-    def tearDown(self):
+    @classmethod
+    def tearDownClass(cls):
         import shutil
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
-        shutil.rmtree(self.config_dir, ignore_errors=True)
+        shutil.rmtree(cls._shared_dir, ignore_errors=True)
+
+    def setUp(self):
+        # Chunker only reads config attributes, so a plain namespace will do
+        self.config = SimpleNamespace(chunk_size=104857600)
+        self.chunker = Chunker(self.config)
+        self._tmp = tempfile.TemporaryDirectory(ignore_cleanup_errors=True)
+        self.addCleanup(self._tmp.cleanup)
+        self.temp_dir = self._tmp.name
 
     def test_get_chunk_count_small_file(self):
         """Test chunk count for file smaller than chunk size"""
@@ -54,14 +54,15 @@ class TestChunker(unittest.TestCase):
         count = self.chunker.get_chunk_count(file_size, chunk_size)
         self.assertEqual(count, 3)
 
+    def test_get_chunk_count_fractional_size(self):
+        """Test chunk count rounds up for a non-integral number of chunks"""
+        chunk_size = 1024 * 1024
+        count = self.chunker.get_chunk_count(5.5 * 1024 * 1024, chunk_size)
+        self.assertEqual(count, 6)
+
     def test_split_file_streaming(self):
         """Test streaming file splitting"""
-        # Create a test file
-        test_file = os.path.join(self.temp_dir, 'test.bin')
-        test_data = b'A' * 1024 * 1024  # 1MB
-        with open(test_file, 'wb') as f:
-            f.write(test_data)
-        
+        test_file = self._file_1mb
         chunk_size = 512 * 1024  # 512KB
         chunks = list(self.chunker.split_file_streaming(test_file, chunk_size))
         
@@ -84,11 +85,7 @@ class TestChunker(unittest.TestCase):
 
     def test_split_file_partial_last_chunk(self):
         """Test splitting where last chunk is partial"""
-        test_file = os.path.join(self.temp_dir, 'test.bin')
-        test_data = b'B' * (1024 * 1024 + 100)  # 1MB + 100 bytes
-        with open(test_file, 'wb') as f:
-            f.write(test_data)
-        
+        test_file = self._file_1mb_plus
         chunk_size = 512 * 1024  # 512KB
         chunks = list(self.chunker.split_file_streaming(test_file, chunk_size))
         
@@ -112,8 +109,8 @@ class TestChunker(unittest.TestCase):
         # Split into chunks
         chunk_size = 50 * 1024
         chunks_data = []
-        for _, data, _, _ in self.chunker.split_file_streaming(test_file, chunk_size):
-            chunks_data.append(data)
+        for index, data, _, _ in self.chunker.split_file_streaming(test_file, chunk_size):
+            chunks_data.append((index, data))
         
         # Reassemble
         output_file = os.path.join(self.temp_dir, 'reassembled.bin')
@@ -10,13 +10,11 @@ from config import Config
 
 class TestConfig(unittest.TestCase):
     def setUp(self):
-        self.config_dir = tempfile.mkdtemp()
+        self._tmp = tempfile.TemporaryDirectory(ignore_cleanup_errors=True)
+        self.addCleanup(self._tmp.cleanup)
+        self.config_dir = self._tmp.name
         self.config_file = os.path.join(self.config_dir, 'config.json')
 
-    def tearDown(self):
-        import shutil
-        shutil.rmtree(self.config_dir, ignore_errors=True)
-
     def test_load_valid_config(self):
         """Test loading a valid config file"""
         config_data = {
@@ -101,6 +99,32 @@ class TestConfig(unittest.TestCase):
         # When use_crypt is False, use base remotes
         self.assertEqual(config.remotes, ["mega1:", "mega2:"])
 
+    def test_default_config(self):
+        """Test default values when no config file exists"""
+        config = Config(self.config_file)
+        
+        self.assertEqual(config.chunk_size, 104857600)
+        self.assertEqual(config.data_prefix, "rclonepool_data")
+        self.assertTrue(config.use_crypt)
+
+    def test_config_save_load(self):
+        """Test saving and reloading a config"""
+        config = Config(self.config_file)
+        config._data["remotes"] = ["test1:", "test2:"]
+        config.save()
+        
+        config2 = Config(self.config_file)
+        self.assertEqual(config2._data["remotes"], ["test1:", "test2:"])
+
+    def test_config_properties(self):
+        """Test remote properties reflect the underlying data"""
+        config = Config(self.config_file)
+        config._data["remotes"] = ["mega1:", "mega2:"]
+        config._data["use_crypt"] = False
+        
+        self.assertEqual(config.remotes, ["mega1:", "mega2:"])
+        self.assertEqual(config.base_remotes, ["mega1:", "mega2:"])
+
 
 if __name__ == '__main__':
     unittest.main()
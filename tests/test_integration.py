@@ -5,8 +5,10 @@ Tests the full workflow with local file system remotes.
 import unittest
 import tempfile
 import shutil
+import subprocess
 import os
 import json
+import io
 import sys
 
 # Add parent directory to path
@@ -15,6 +17,21 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from config import Config
 from rclonepool import RclonePool
 
+# /dev/shm is only used for test data if it has at least this much free space
+MIN_TMPFS_FREE = 256 * 1024 * 1024
+
+
+def _test_tmp_base():
+    """Pick the base directory for test data, preferring tmpfs on Linux"""
+    base = os.environ.get('RCLONEPOOL_TEST_TMPDIR')
+    if base:
+        return base
+    if os.path.isdir('/dev/shm'):
+        if shutil.disk_usage('/dev/shm').free >= MIN_TMPFS_FREE:
+            return '/dev/shm'
+        sys.stderr.write("/dev/shm has less than 256 MiB free, using the default temp dir\n")
+    return None
+
 
 class TestRclonePoolIntegration(unittest.TestCase):
     """Integration tests using local file system as remotes"""
@@ -22,7 +39,12 @@ class TestRclonePoolIntegration(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
         """Set up test environment once for all tests"""
-        cls.test_dir = tempfile.mkdtemp(prefix='rclonepool_test_')
+        base = _test_tmp_base()
+        cls.test_dir = tempfile.mkdtemp(prefix='rclonepool_test_', dir=base)
+        # Keep other temp files created during the tests on the same filesystem
+        cls._saved_tempdir = tempfile.tempdir
+        if base:
+            tempfile.tempdir = base
         cls.config_dir = os.path.join(cls.test_dir, 'config')
         cls.remote_dir = os.path.join(cls.test_dir, 'remotes')
         cls.temp_dir = os.path.join(cls.test_dir, 'temp')
@@ -71,26 +93,34 @@ nounc = true
         with open(cls.config_file, 'w') as f:
             json.dump(config_data, f)
 
+        # Check once whether rclone is available
+        try:
+            subprocess.run(['rclone', 'version'], 
+                         capture_output=True, 
+                         timeout=5,
+                         check=True)
+            cls._rclone_available = True
+        except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired):
+            cls._rclone_available = False
+
+        # One pool shared by all tests; each test uses its own remote paths
+        cls.pool = RclonePool(cls.config_file) if cls._rclone_available else None
+
     @classmethod
     def tearDownClass(cls):
         """Clean up test environment"""
         if 'RCLONE_CONFIG' in os.environ:
             del os.environ['RCLONE_CONFIG']
+        tempfile.tempdir = cls._saved_tempdir
         shutil.rmtree(cls.test_dir, ignore_errors=True)
 
     def setUp(self):
         """Set up before each test"""
-        # Check if rclone is available
-        import subprocess
-        try:
-            subprocess.run(['rclone', 'version'], 
-                         capture_output=True, 
-                         timeout=5,
-                         check=True)
-        except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired):
+        if not self._rclone_available:
             self.skipTest("rclone not available")
         
-        self.pool = RclonePool(self.config_file)
+        # Read manifests from the remotes, not another test's cached copies
+        self.pool.manifest_mgr._manifest_cache.clear()
 
     def test_upload_small_file(self):
         """Test uploading a file smaller than chunk size"""
@@ -133,6 +163,32 @@ nounc = true
         
         self.assertEqual(test_data, downloaded_data)
 
+    def test_upload_stream_roundtrip(self):
+        """Test uploading from a stream in several chunks and downloading it back"""
+        test_data = os.urandom(250000)  # 3 chunks at 100KB
+
+        success = self.pool.upload_stream(io.BytesIO(test_data), len(test_data), '/stream/data.bin')
+        self.assertTrue(success)
+
+        manifest = self.pool.manifest_mgr.load_manifest_for_file('/stream/data.bin')
+        self.assertEqual(manifest['chunk_count'], 3)
+
+        output_file = os.path.join(self.data_dir, 'stream_downloaded.bin')
+        self.assertTrue(self.pool.download('/stream/data.bin', output_file))
+        with open(output_file, 'rb') as f:
+            self.assertEqual(f.read(), test_data)
+
+    def test_download_range_across_chunks_parallel(self):
+        """Test a range spanning chunks reads the same bytes with parallel downloads on"""
+        test_data = os.urandom(250000)
+        self.assertTrue(self.pool.upload_stream(io.BytesIO(test_data), len(test_data), '/range/data.bin'))
+
+        self.pool.config._data['parallel_downloads'] = True
+        self.addCleanup(self.pool.config._data.pop, 'parallel_downloads')
+
+        data = self.pool.download_range('/range/data.bin', 90000, 150000)
+        self.assertEqual(data, test_data[90000:240000])
+
     def test_list_files(self):
         """Test listing files"""
         # Upload a couple files
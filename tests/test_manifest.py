@@ -11,7 +11,9 @@ from config import Config
 
 class TestManifestManager(unittest.TestCase):
     def setUp(self):
-        self.config_dir = tempfile.mkdtemp()
+        self._tmp = tempfile.TemporaryDirectory(ignore_cleanup_errors=True)
+        self.addCleanup(self._tmp.cleanup)
+        self.config_dir = self._tmp.name
         self.config_file = os.path.join(self.config_dir, 'config.json')
         
         config_data = {
@@ -34,10 +36,6 @@ class TestManifestManager(unittest.TestCase):
         self.mock_backend = MockBackend()
         self.mgr = ManifestManager(self.config, self.mock_backend)
 
-    def tearDown(self):
-        import shutil
-        shutil.rmtree(self.config_dir, ignore_errors=True)
-
     def test_create_manifest(self):
         """Test manifest creation"""
         chunks = [
@@ -91,20 +89,159 @@ class TestManifestManager(unittest.TestCase):
         self.assertIn('/cached.txt', self.mgr._manifest_cache)
 
 
+    def test_load_sorts_chunks_and_records_offsets(self):
+        """Test loaded manifests have chunks in index order and offsets that are not saved"""
+        manifest = self.mgr.create_manifest(
+            file_name='sorted.bin',
+            remote_dir='/',
+            file_size=300,
+            chunk_size=100,
+            chunks=[{'index': i, 'remote': 'test1:', 'path': f'data/sorted.chunk.{i:03d}',
+                     'size': 100, 'offset': i * 100} for i in (2, 0, 1)]
+        )
+        self.mgr.save_manifest(manifest)
+        self.mgr._manifest_cache.clear()
+
+        loaded = self.mgr.load_manifest_for_file('/sorted.bin')
+
+        self.assertEqual([c['index'] for c in loaded['chunks']], [0, 1, 2])
+        self.assertEqual(loaded['_chunk_offsets'], [0, 100, 200])
+        stored = json.loads(self.mock_backend.manifests['rclonepool_manifests/sorted.bin.manifest.json'])
+        self.assertNotIn('_chunk_offsets', stored)
+
+    def test_malformed_manifest_does_not_break_listing(self):
+        """Test manifests missing chunks or offsets still list and snapshot"""
+        self.mock_backend.upload_bytes(json.dumps({
+            'file_name': 'bare.txt', 'remote_dir': '/', 'file_path': '/bare.txt', 'file_size': 0
+        }).encode(), 'test1:', 'rclonepool_manifests/bare.txt.manifest.json')
+        self.mock_backend.upload_bytes(json.dumps({
+            'file_name': 'old.txt', 'remote_dir': '/', 'file_path': '/old.txt', 'file_size': 1,
+            'chunks': [{'index': 0, 'remote': 'test1:', 'path': 'data/old.chunk.000', 'size': 1}]
+        }).encode(), 'test1:', 'rclonepool_manifests/old.txt.manifest.json')
+
+        manifests = self.mgr.list_manifests('/')
+
+        self.assertEqual(sorted(m['file_name'] for m in manifests), ['bare.txt', 'old.txt'])
+        self.assertEqual(sorted(self.mgr.snapshot().by_path), ['/bare.txt', '/old.txt'])
+        bare = next(m for m in manifests if m['file_name'] == 'bare.txt')
+        self.assertEqual((bare['chunks'], bare['_chunk_offsets']), ([], []))
+
+    def test_rename_manifest(self):
+        """Test rename writes the manifest under the new path and removes the old one"""
+        chunks = [{'index': 0, 'remote': 'test1:', 'path': 'data/old.chunk.000', 'size': 5, 'offset': 0}]
+        self.mgr.save_manifest(self.mgr.create_manifest(
+            file_name='old.txt',
+            remote_dir='/a',
+            file_size=5,
+            chunk_size=104857600,
+            chunks=chunks
+        ))
+
+        renamed = self.mgr.rename_manifest('/a/old.txt', '/b/c/new.txt')
+
+        self.assertEqual((renamed['file_name'], renamed['remote_dir'], renamed['file_path']),
+                         ('new.txt', '/b/c', '/b/c/new.txt'))
+        self.assertEqual(renamed['chunks'], chunks)
+        self.assertEqual(sorted(self.mock_backend.manifests),
+                         ['rclonepool_manifests/b_c_new.txt.manifest.json'])
+        self.mgr._manifest_cache.clear()
+        self.assertIsNone(self.mgr.load_manifest_for_file('/a/old.txt'))
+        self.assertIsNone(self.mgr.rename_manifest('/missing.txt', '/x.txt'))
+
+    def test_list_manifests_concurrent_fetch(self):
+        """Test manifests fetched concurrently keep listing order"""
+        for name in ('a.txt', 'b.txt', 'c.txt'):
+            self.mgr.save_manifest(self.mgr.create_manifest(
+                file_name=name,
+                remote_dir='/docs',
+                file_size=1,
+                chunk_size=104857600,
+                chunks=[]
+            ))
+        
+        manifests = self.mgr.list_manifests('/', recursive=True, workers=3)
+        
+        self.assertEqual([m['file_path'] for m in manifests],
+                         ['/docs/a.txt', '/docs/b.txt', '/docs/c.txt'])
+        self.assertEqual(self.mgr.list_manifests('/', workers=3), [])
+
+    def test_snapshot_groups_by_dir_and_reuses_unchanged(self):
+        """Test snapshot groups manifests by directory and only refetches changed ones"""
+        for name, remote_dir in (('a.txt', '/'), ('b.txt', '/docs'), ('c.txt', '/docs')):
+            self.mgr.save_manifest(self.mgr.create_manifest(
+                file_name=name,
+                remote_dir=remote_dir,
+                file_size=1,
+                chunk_size=104857600,
+                chunks=[]
+            ))
+
+        snapshot = self.mgr.snapshot()
+        self.assertEqual(sorted(snapshot.by_dir), ['/', '/docs'])
+        self.assertEqual([m['file_name'] for m in snapshot.by_dir['/docs']], ['b.txt', 'c.txt'])
+        self.assertEqual(sorted(snapshot.by_path), ['/a.txt', '/docs/b.txt', '/docs/c.txt'])
+        self.assertEqual(snapshot.dirs, {'/', '/docs'})
+
+        self.mock_backend.downloads = 0
+        self.assertEqual(self.mgr.snapshot().version, snapshot.version)
+        self.assertEqual(self.mock_backend.downloads, 0)
+
+        self.mgr.delete_manifest('/docs/b.txt')
+        updated = self.mgr.snapshot()
+        self.assertGreater(updated.version, snapshot.version)
+        self.assertEqual([m['file_name'] for m in updated.by_dir['/docs']], ['c.txt'])
+        self.assertNotIn('/docs/b.txt', updated.by_path)
+        self.assertEqual(self.mock_backend.downloads, 0)
+
+    def test_snapshot_sees_rewrite_within_same_mtime(self):
+        """Test snapshot reflects saves and deletes even when lsf mtimes do not change"""
+        # lsf mtimes have one-second resolution: every write lands in the same second
+        self.mock_backend.list_files_with_mtimes = lambda remote, prefix: {
+            name: '2026-01-01 00:00:00' for name in self.mock_backend.list_files(remote, prefix)}
+
+        def save(size):
+            self.mgr.save_manifest(self.mgr.create_manifest(
+                file_name='f.bin', remote_dir='/', file_size=size,
+                chunk_size=104857600, chunks=[]))
+
+        save(10)
+        self.assertEqual(self.mgr.snapshot().by_path['/f.bin']['file_size'], 10)
+
+        save(99)
+        self.assertEqual(self.mgr.snapshot().by_path['/f.bin']['file_size'], 99)
+
+        self.mgr.delete_manifest('/f.bin')
+        save(7)
+        self.assertEqual(self.mgr.snapshot().by_path['/f.bin']['file_size'], 7)
+
+
 class MockBackend:
     """Mock backend for testing"""
     def __init__(self):
         self.manifests = {}
+        self.mtimes = {}
+        self.downloads = 0
     
     def upload_bytes(self, data, remote, remote_path):
         self.manifests[remote_path] = data
+        self.mtimes[remote_path] = len(self.mtimes)
         return True
     
     def download_bytes(self, remote, remote_path, suppress_errors=False):
+        self.downloads += 1
         return self.manifests.get(remote_path)
     
+    def delete_file(self, remote, remote_path):
+        self.manifests.pop(remote_path, None)
+        self.mtimes.pop(remote_path, None)
+    
     def list_files(self, remote, prefix):
-        return []
+        return [path[len(prefix) + 1:] for path in self.manifests
+                if path.startswith(prefix + '/')]
+    
+    def list_files_with_mtimes(self, remote, prefix):
+        return {path[len(prefix) + 1:]: self.mtimes[path] for path in self.manifests
+                if path.startswith(prefix + '/')}
 
 
 if __name__ == '__main__':
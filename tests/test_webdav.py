@@ -0,0 +1,452 @@
+"""
+Tests for webdav_server.py
+"""
+import unittest
+import io
+import os
+import shutil
+import signal
+import socket
+import tempfile
+import threading
+import time
+import http.client
+import xml.etree.ElementTree as ET
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+from config import DEFAULT_CONFIG
+from manifest import ManifestSnapshot
+from webdav_server import RclonePoolDAVServer, StopServing, ThreadedHTTPServer, WebDAVHandler
+
+
+class TestWebDAVHandler(unittest.TestCase):
+    def setUp(self):
+        self.chunk_data = {'p0': b'abc', 'p1': b'def'}
+        self.manifest = {
+            'file_name': 'a.bin',
+            'remote_dir': '/',
+            'file_path': '/a.bin',
+            'file_size': 6,
+            'created_at': 0,
+            'chunks': [
+                {'index': 0, 'remote': 'r1:', 'path': 'p0', 'size': 3, 'offset': 0},
+                {'index': 1, 'remote': 'r1:', 'path': 'p1', 'size': 3, 'offset': 3},
+            ],
+            '_chunk_offsets': [0, 3]
+        }
+
+        temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_dir, ignore_errors=True)
+
+        self.pool = SimpleNamespace(
+            config=SimpleNamespace(zero_copy_send=True, webdav_cache_ttl=60.0, webdav_timeout=5.0,
+                                   stream_uploads=True,
+                                   put_read_size=4, temp_dir=temp_dir,
+                                   enable_prefetch=True, prefetch_chunks=2, prefetch_max_mb=1,
+                                   max_parallel_workers=2,
+                                   low_latency_stream=False, propfind_chunked=False,
+                                   max_upload_size=0, min_free_disk=0, chunk_size=1024),
+            manifest_mgr=Mock(),
+            backend=Mock()
+        )
+        self.pool.manifest_mgr.load_manifest_for_file.return_value = self.manifest
+        self.pool.manifest_mgr.snapshot.return_value = ManifestSnapshot(
+            1, {'/': [self.manifest]}, {'/a.bin': self.manifest}, {'/'})
+        self.pool.backend.download_bytes.side_effect = lambda remote, path: self.chunk_data[path]
+        self.pool.backend.download_to_tempfile.side_effect = self._chunk_file
+
+        # Per-test handler subclass so the pool is not shared between tests
+        handler = type('Handler', (WebDAVHandler,), {})
+        handler.configure(self.pool)
+        self.addCleanup(handler.close)
+        self.handler = handler
+        self.server = ThreadedHTTPServer(('127.0.0.1', 0), handler, max_workers=2)
+        threading.Thread(target=self.server.serve_forever, kwargs={'poll_interval': 0.05}, daemon=True).start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+
+    def _chunk_file(self, remote, path):
+        f = tempfile.TemporaryFile()
+        f.write(self.chunk_data[path])
+        f.seek(0)
+        return f
+
+    def request(self, method, path, body=None, headers=None):
+        conn = http.client.HTTPConnection('127.0.0.1', self.server.server_address[1], timeout=5)
+        try:
+            conn.request(method, path, body=body, headers=headers or {})
+            response = conn.getresponse()
+            return response, response.read()
+        finally:
+            conn.close()
+
+    def test_get_full_file_zero_copy(self):
+        """Test full GET sends chunk files in order without reading them into memory"""
+        response, data = self.request('GET', '/a.bin')
+
+        self.assertEqual(response.status, 200)
+        self.assertEqual(data, b'abcdef')
+        self.pool.backend.download_bytes.assert_not_called()
+
+    def test_get_full_file_buffered(self):
+        """Test full GET falls back to in-memory chunks when zero-copy is off"""
+        self.pool.config.zero_copy_send = False
+
+        response, data = self.request('GET', '/a.bin')
+
+        self.assertEqual(data, b'abcdef')
+        self.pool.backend.download_to_tempfile.assert_not_called()
+
+    def test_get_full_file_prefetches_next_chunk(self):
+        """Test full GET downloads the following chunk while the current one is pending"""
+        self.pool.config.zero_copy_send = False
+        second_started = threading.Event()
+
+        def download_bytes(remote, path):
+            if path == 'p0':
+                # Only completes if p1 is fetched concurrently
+                self.assertTrue(second_started.wait(5))
+            else:
+                second_started.set()
+            return self.chunk_data[path]
+
+        self.pool.backend.download_bytes.side_effect = download_bytes
+
+        response, data = self.request('GET', '/a.bin')
+
+        self.assertEqual(data, b'abcdef')
+        self.assertEqual(self.handler._prefetch_budget._used, 0)
+
+    def test_get_full_file_prefetch_within_shared_budget(self):
+        """Test chunks are fetched on the request thread once the prefetch budget is spent"""
+        self.pool.config.zero_copy_send = False
+        self.pool.config.prefetch_max_mb = 0
+        self.handler.configure(self.pool)
+        threads = []
+
+        def download_bytes(remote, path):
+            threads.append(threading.current_thread().name)
+            return self.chunk_data[path]
+
+        self.pool.backend.download_bytes.side_effect = download_bytes
+
+        response, data = self.request('GET', '/a.bin')
+
+        self.assertEqual(data, b'abcdef')
+        self.assertEqual(len(threads), 2)
+        self.assertFalse(any(name.startswith('webdav-prefetch') for name in threads))
+        self.assertEqual(self.handler._prefetch_budget._used, 0)
+
+    def test_get_range_forms(self):
+        """Test bounded, open-ended and suffix ranges map to the right byte span"""
+        self.pool.download_range = Mock(side_effect=lambda path, start, length: b'abcdef'[start:start + length])
+
+        for header, content_range, body in (('bytes=1-2', 'bytes 1-2/6', b'bc'),
+                                            ('bytes=4-', 'bytes 4-5/6', b'ef'),
+                                            ('bytes=-2', 'bytes 4-5/6', b'ef'),
+                                            ('bytes=3-99', 'bytes 3-5/6', b'def')):
+            response, data = self.request('GET', '/a.bin', headers={'Range': header})
+            self.assertEqual(response.status, 206, header)
+            self.assertEqual(response.getheader('Content-Range'), content_range)
+            self.assertEqual(data, body)
+
+    def test_get_range_not_satisfiable(self):
+        """Test malformed, multi-part and out-of-bounds ranges are rejected with 416"""
+        self.pool.download_range = Mock()
+
+        for header in ('bytes=6-', 'bytes=3-1', 'bytes=0-1,3-4', 'items=0-1', 'bytes=-'):
+            response, _ = self.request('GET', '/a.bin', headers={'Range': header})
+            self.assertEqual(response.status, 416, header)
+        self.pool.download_range.assert_not_called()
+
+    def test_manifest_lookup_cached_until_delete(self):
+        """Test repeated requests reuse the cached manifest and DELETE drops it"""
+        self.pool.delete = Mock(return_value=True)
+
+        self.request('GET', '/a.bin')
+        self.request('GET', '/a.bin')
+        self.assertEqual(self.pool.manifest_mgr.load_manifest_for_file.call_count, 1)
+
+        self.request('DELETE', '/a.bin')
+        self.pool.manifest_mgr.load_manifest_for_file.return_value = None
+        self.pool.manifest_mgr.list_manifests.return_value = []
+        response, _ = self.request('GET', '/a.bin')
+
+        self.assertEqual(response.status, 404)
+        self.assertEqual(self.pool.manifest_mgr.load_manifest_for_file.call_count, 2)
+
+    def test_head_answers_from_snapshot(self):
+        """Test HEAD resolves files, ancestor dirs and misses without per-path lookups"""
+        nested = dict(self.manifest, file_name='b.bin', remote_dir='/x/y', file_path='/x/y/b.bin')
+        self.pool.manifest_mgr.snapshot.return_value = ManifestSnapshot(
+            1, {'/x/y': [nested]}, {'/x/y/b.bin': nested}, {'/', '/x', '/x/y'})
+
+        file_response, _ = self.request('HEAD', '/x/y/b.bin')
+        dir_response, _ = self.request('HEAD', '/x/')
+        missing_response, _ = self.request('HEAD', '/nope.bin')
+
+        self.assertEqual(file_response.getheader('Content-Length'), '6')
+        self.assertEqual(dir_response.getheader('Content-Type'), 'httpd/unix-directory')
+        self.assertEqual(missing_response.status, 404)
+        self.pool.manifest_mgr.snapshot.assert_called_once()
+        self.pool.manifest_mgr.load_manifest_for_file.assert_not_called()
+        self.pool.manifest_mgr.list_manifests.assert_not_called()
+
+    def test_directory_listing_escapes_names(self):
+        """Test the HTML listing escapes file names instead of injecting markup"""
+        self.manifest['file_name'] = '<script>x</script>.mp4'
+        self.manifest['file_path'] = '/<script>x</script>.mp4'
+        self.pool.manifest_mgr.list_manifests.return_value = [self.manifest]
+
+        response, data = self.request('GET', '/')
+
+        self.assertEqual(response.status, 200)
+        self.assertNotIn(b'<script>', data)
+        self.assertIn(b'&lt;script&gt;x&lt;/script&gt;.mp4', data)
+        self.assertIn(b'6.0 B', data)
+
+    def test_put_streams_body_to_pool(self):
+        """Test PUT hands the request body to upload_stream without staging it"""
+        received = {}
+
+        def upload_stream(stream, size, path):
+            received[path] = stream.read(size)
+            return True
+
+        self.pool.upload_stream = upload_stream
+        self.pool.upload = Mock()
+
+        response, _ = self.request('PUT', '/new.bin', body=b'payload')
+
+        self.assertEqual(response.status, 201)
+        self.assertEqual(received, {'/new.bin': b'payload'})
+        self.pool.upload.assert_not_called()
+
+    def test_put_staged_body_reassembled(self):
+        """Test PUT with streaming off stages the whole body through the read buffer"""
+        self.pool.config.stream_uploads = False
+        received = {}
+
+        def upload(temp_path, path):
+            with open(temp_path, 'rb') as f:
+                received[path] = f.read()
+            return True
+
+        self.pool.upload = upload
+
+        response, _ = self.request('PUT', '/new.bin', body=b'0123456789')
+
+        self.assertEqual(response.status, 201)
+        self.assertEqual(received, {'/new.bin': b'0123456789'})
+
+    def test_propfind_root_uses_shared_snapshot(self):
+        """Test root PROPFIND lists top-level dirs and root files from one snapshot"""
+        nested = dict(self.manifest, file_name='b.bin', remote_dir='/x/y', file_path='/x/y/b.bin')
+        self.pool.manifest_mgr.snapshot.return_value = ManifestSnapshot(
+            1, {'/': [self.manifest], '/x/y': [nested]}, {}, set())
+
+        self.request('PROPFIND', '/', headers={'Depth': '1'})
+        response, data = self.request('PROPFIND', '/', headers={'Depth': '1'})
+
+        self.assertEqual(response.status, 207)
+        ns = {'D': 'DAV:'}
+        hrefs = [e.text for e in ET.fromstring(data).findall('D:response/D:href', ns)]
+        self.assertEqual(hrefs, ['/', '/x/', '/a.bin'])
+        self.pool.manifest_mgr.snapshot.assert_called_once()
+
+    def test_put_rejects_oversized_upload(self):
+        """Test PUT over max_upload_size gets 413 without reaching the pool"""
+        self.pool.config.max_upload_size = 4
+        self.pool.upload_stream = Mock()
+
+        response, _ = self.request('PUT', '/big.bin', body=b'0123456789')
+
+        self.assertEqual(response.status, 413)
+        self.pool.upload_stream.assert_not_called()
+
+    def test_put_rejects_when_temp_dir_full(self):
+        """Test PUT that would eat into min_free_disk gets 507"""
+        self.pool.config.min_free_disk = 1 << 62
+        self.pool.upload_stream = Mock()
+
+        response, _ = self.request('PUT', '/new.bin', body=b'payload')
+
+        self.assertEqual(response.status, 507)
+        self.pool.upload_stream.assert_not_called()
+
+    def test_put_small_upload_on_small_tmpfs(self):
+        """Test the default reserve accepts small PUTs on a nearly full tmpfs; an explicit one rejects them"""
+        self.pool.config.min_free_disk = DEFAULT_CONFIG['min_free_disk']
+        self.pool.upload_stream = Mock(return_value=True)
+        usage = SimpleNamespace(total=128 << 20, used=28 << 20, free=100 << 20)
+
+        with patch('webdav_server.shutil.disk_usage', return_value=usage):
+            response, _ = self.request('PUT', '/new.bin', body=b'payload')
+            self.assertEqual(response.status, 201)
+
+            self.pool.config.min_free_disk = 100 << 20
+            response, _ = self.request('PUT', '/new.bin', body=b'payload')
+            self.assertEqual(response.status, 507)
+
+    def test_propfind_streamed_matches_buffered(self):
+        """Test streamed PROPFIND sends the same XML without a Content-Length"""
+        _, buffered = self.request('PROPFIND', '/', headers={'Depth': '1'})
+
+        self.pool.config.propfind_chunked = True
+        response, streamed = self.request('PROPFIND', '/', headers={'Depth': '1'})
+
+        self.assertEqual(response.status, 207)
+        self.assertIsNone(response.getheader('Content-Length'))
+        self.assertEqual(streamed.replace(self._last_modified(streamed), b''),
+                         buffered.replace(self._last_modified(buffered), b''))
+
+    def test_propfind_streamed_writes_rows_as_generated(self):
+        """Test streamed PROPFIND writes each batch before later rows are rendered"""
+        handler = self.handler.__new__(self.handler)
+        handler.request_version = 'HTTP/1.0'
+        handler.requestline = 'PROPFIND / HTTP/1.0'
+        handler.command = 'PROPFIND'
+        handler.client_address = ('127.0.0.1', 0)
+        handler.wfile = io.BytesIO()
+        seen = []
+
+        def rows():
+            for row in (b'<a/>', b'<b/>'):
+                yield row
+                seen.append(handler.wfile.getvalue())
+
+        with patch('webdav_server._STREAM_BATCH', 1):
+            handler._send_multistatus_streamed(rows())
+
+        self.assertTrue(seen[0].endswith(b'<a/>'))
+        self.assertTrue(seen[1].endswith(b'<b/>'))
+        self.assertTrue(handler.wfile.getvalue().endswith(b'</D:multistatus>'))
+        self.assertTrue(handler.close_connection)
+
+    def _last_modified(self, xml):
+        # The root collection is stamped with the current time on every request
+        return xml.split(b'<D:getlastmodified>')[1].split(b'</D:getlastmodified>')[0]
+
+    def test_propfind_file_is_valid_xml(self):
+        """Test PROPFIND on a file with XML-special characters in its name parses cleanly"""
+        self.manifest['file_path'] = '/a&<b>.mp4'
+
+        response, data = self.request('PROPFIND', '/a%26%3Cb%3E.mp4', headers={'Depth': '0'})
+
+        self.assertEqual(response.status, 207)
+        ns = {'D': 'DAV:'}
+        prop = ET.fromstring(data).find('D:response/D:propstat/D:prop', ns)
+        self.assertEqual(prop.find('D:getcontentlength', ns).text, '6')
+        self.assertEqual(prop.find('D:getcontenttype', ns).text, 'video/mp4')
+
+
+class TestThreadedHTTPServer(unittest.TestCase):
+    def test_request_shutdown_stops_serve_forever(self):
+        """Test request_shutdown ends serve_forever promptly by raising StopServing"""
+        server = ThreadedHTTPServer(('127.0.0.1', 0), WebDAVHandler, max_workers=1)
+        self.addCleanup(server.server_close)
+        raised = []
+
+        def serve():
+            try:
+                server.serve_forever(poll_interval=0.05)
+            except StopServing:
+                raised.append(True)
+
+        thread = threading.Thread(target=serve, daemon=True)
+        thread.start()
+        server.request_shutdown()
+        thread.join(2)
+
+        self.assertFalse(thread.is_alive())
+        self.assertEqual(raised, [True])
+
+    def _serve(self, handler, max_workers):
+        server = ThreadedHTTPServer(('127.0.0.1', 0), handler, max_workers=max_workers)
+        threading.Thread(target=server.serve_forever, kwargs={'poll_interval': 0.05}, daemon=True).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        return server
+
+    def _connect(self, server):
+        sock = socket.create_connection(server.server_address, timeout=5)
+        self.addCleanup(sock.close)
+        return sock
+
+    def test_full_queue_rejected_with_503(self):
+        """Test idle connections filling every worker and queue slot don't block accept"""
+        started, release = threading.Event(), threading.Event()
+        self.addCleanup(release.set)
+
+        def handle(handler):
+            started.set()
+            release.wait(5)
+
+        server = self._serve(type('Handler', (WebDAVHandler,), {'handle': handle}), max_workers=1)
+
+        self._connect(server)
+        self.assertTrue(started.wait(5))  # Held by the only worker
+        self._connect(server)  # Fills the queue
+        busy = self._connect(server)
+
+        self.assertTrue(busy.recv(1024).startswith(b'HTTP/1.0 503'))
+
+    def test_idle_client_timed_out(self):
+        """Test a client that never sends a request is dropped after the handler timeout"""
+        handler = type('Handler', (WebDAVHandler,), {'timeout': 0.1})
+        server = self._serve(handler, max_workers=1)
+
+        idle = self._connect(server)
+
+        self.assertEqual(idle.recv(1024), b'')
+
+    def test_server_close_ignores_idle_clients(self):
+        """Test server_close returns at once while a client holds a worker"""
+        server = ThreadedHTTPServer(('127.0.0.1', 0), WebDAVHandler, max_workers=1)
+        thread = threading.Thread(target=server.serve_forever, kwargs={'poll_interval': 0.05}, daemon=True)
+        thread.start()
+        self._connect(server)
+        self._connect(server)
+
+        started = time.monotonic()
+        server.shutdown()
+        server.server_close()
+
+        self.assertLess(time.monotonic() - started, 1)
+
+
+class TestRclonePoolDAVServer(unittest.TestCase):
+    def test_signal_stops_run_with_client_connected(self):
+        """Test run() returns promptly after SIGTERM while a client holds a worker"""
+        original = signal.getsignal(signal.SIGTERM)
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            self.addCleanup(signal.signal, sig, signal.getsignal(sig))
+        config = SimpleNamespace(webdav_workers=1, webdav_timeout=30.0, webdav_cache_ttl=5.0,
+                                 max_parallel_workers=1, prefetch_max_mb=0)
+        dav = RclonePoolDAVServer(SimpleNamespace(config=config), host='127.0.0.1', port=0)
+        signalled = []
+
+        def client():
+            deadline = time.monotonic() + 5
+            while signal.getsignal(signal.SIGTERM) is original and time.monotonic() < deadline:
+                time.sleep(0.01)
+            sock = socket.create_connection(dav.server.server_address, timeout=5)
+            self.addCleanup(sock.close)
+            time.sleep(0.2)  # Let the only worker start reading from the idle client
+            signalled.append(time.monotonic())
+            os.kill(os.getpid(), signal.SIGTERM)
+
+        threading.Thread(target=client, daemon=True).start()
+        # Backstop so a regression fails the test instead of hanging it
+        watchdog = threading.Timer(10, lambda: dav.server.shutdown())
+        watchdog.start()
+        self.addCleanup(watchdog.cancel)
+
+        dav.run()
+
+        self.assertEqual(len(signalled), 1)
+        self.assertLess(time.monotonic() - signalled[0], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -9,12 +9,30 @@ Provides commands to:
 """
 
 import os
+import sys
+import math
+import hashlib
 import logging
-from typing import List, Dict, Set, Tuple, Optional
+import marshal
+import mmap
+import threading
+from array import array
+from collections import defaultdict
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ThreadPoolExecutor,
+    as_completed,
+    wait,
+)
+from typing import List, Dict, Sequence, Set, Optional
 from dataclasses import dataclass
 
 log = logging.getLogger("rclonepool")
 
+# Manifest index format version plus the Python version that wrote it
+_MANIFEST_INDEX_TAG = f"2:{sys.version_info.major}.{sys.version_info.minor}"
+
 
 @dataclass
 class VerificationResult:
@@ -22,7 +40,7 @@ class VerificationResult:
 
     file_path: str
     status: str  # "ok", "missing_chunks", "corrupt", "error"
-    missing_chunks: List[int]
+    missing_chunks: Sequence[int]  # array('i') from verify_file, list elsewhere
     error_message: Optional[str] = None
     total_chunks: int = 0
     verified_chunks: int = 0
@@ -37,6 +55,62 @@ class OrphanChunk:
     size: int
 
 
+class BloomFilter:
+    """Fixed-size Bloom filter over strings (no false negatives)."""
+
+    def __init__(
+        self, capacity: int, error_rate: float = 0.001, salt: Optional[bytes] = None
+    ):
+        """
+        Initialize Bloom filter.
+
+        Args:
+            capacity: Expected number of items
+            error_rate: Target false positive rate at capacity
+            salt: 16-byte hash salt; random by default
+        """
+        capacity = max(1, capacity)
+        self.num_bits = max(
+            8, int(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        )
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self._bits = bytearray((self.num_bits + 7) // 8)
+        # Fresh salt per filter so false positives differ between runs
+        self._salt = os.urandom(16) if salt is None else salt
+
+    def _positions(self, item: str):
+        digest = hashlib.blake2b(
+            item.encode("utf-8"), digest_size=16, salt=self._salt
+        ).digest()
+        # Double hashing: k positions from two 64-bit halves of one digest
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+
+    def add(self, item: str):
+        """Add an item to the filter."""
+        for pos in self._positions(item):
+            self._bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, item: str) -> bool:
+        return all(
+            self._bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item)
+        )
+
+
+def _manifest_not_found(file_path: str) -> VerificationResult:
+    """Result for a file whose manifest could not be loaded."""
+    return VerificationResult(
+        file_path=file_path,
+        status="error",
+        missing_chunks=[],
+        error_message="Manifest not found",
+        total_chunks=0,
+        verified_chunks=0,
+    )
+
+
 class Verifier:
     """Handles verification and repair operations."""
 
@@ -52,56 +126,147 @@ class Verifier:
         self.config = config
         self.backend = backend
         self.manifest_mgr = manifest_mgr
-
-    def verify_file(self, file_path: str, quick: bool = False) -> VerificationResult:
+        # remote -> {chunk path: size} under data_prefix (None if listing
+        # failed), shared by verify_file/verify_all and find_orphans
+        self._remote_listing_cache: Dict[str, Optional[Dict[str, int]]] = {}
+        self._listing_locks: Dict[str, threading.Lock] = {}
+        self._listing_locks_guard = threading.Lock()
+
+    def verify_file(
+        self, file_path: str, quick: bool = False, fail_fast: bool = False
+    ) -> VerificationResult:
         """
         Verify a single file's chunks exist.
 
         Args:
             file_path: Remote file path
             quick: If True, only check existence; if False, also verify sizes
+            fail_fast: If True, stop at the first missing chunk, so
+                missing_chunks and verified_chunks are partial
 
         Returns:
             VerificationResult
         """
-        log.info(f"Verifying {file_path}...")
-
         # Load manifest
         manifest = self.manifest_mgr.load_manifest_for_file(file_path)
         if not manifest:
-            return VerificationResult(
-                file_path=file_path,
-                status="error",
-                missing_chunks=[],
-                error_message="Manifest not found",
-                total_chunks=0,
-                verified_chunks=0,
-            )
+            return _manifest_not_found(file_path)
+
+        return self._verify_manifest(manifest, quick, fail_fast)
+
+    def verify_chunks(
+        self, file_path: str, chunk_indices: Sequence[int], quick: bool = False
+    ) -> VerificationResult:
+        """
+        Verify only the given chunks of a file.
+
+        Args:
+            file_path: Remote file path
+            chunk_indices: Indices of the chunks to check
+            quick: If True, only check existence; if False, also verify sizes
+
+        Returns:
+            VerificationResult covering just those chunks
+        """
+        manifest = self.manifest_mgr.load_manifest_for_file(file_path)
+        if not manifest:
+            return _manifest_not_found(file_path)
+
+        wanted = set(chunk_indices)
+        subset = {
+            **manifest,
+            "chunks": [
+                chunk
+                for chunk in manifest.get("chunks", [])
+                if chunk.get("index") in wanted
+            ],
+        }
+        return self._verify_manifest(subset, quick)
+
+    def is_intact(self, file_path: str) -> bool:
+        """
+        Check whether every chunk of a file is present with the expected size.
+
+        Stops at the first missing chunk, so it is cheaper than verify_file
+        when only a yes/no answer is needed.
+
+        Args:
+            file_path: Remote file path
+
+        Returns:
+            True if the file has a manifest and all its chunks are intact
+        """
+        return self.verify_file(file_path, fail_fast=True).status == "ok"
+
+    def _verify_manifest(
+        self, manifest: dict, quick: bool, fail_fast: bool = False
+    ) -> VerificationResult:
+        """
+        Verify the chunks referenced by an already-loaded manifest.
+
+        Args:
+            manifest: Manifest dict
+            quick: If True, only check existence; if False, also verify sizes
+            fail_fast: If True, stop at the first missing chunk
+
+        Returns:
+            VerificationResult
+        """
+        file_path = manifest.get("file_path")
+        log.info(f"Verifying {file_path}...")
 
         chunks = manifest.get("chunks", [])
         total_chunks = len(chunks)
-        missing_chunks = []
+        # Machine ints rather than boxed ones: a fully offline remote can leave
+        # every chunk of a very large file missing
+        missing_chunks = array("i")
         verified_chunks = 0
 
         log.info(f"  Checking {total_chunks} chunks...")
 
+        # Group by remote so each remote is listed once, not probed per chunk
+        by_remote: Dict[str, List[dict]] = defaultdict(list)
         for chunk in chunks:
-            chunk_index = chunk.get("index")
-            remote = chunk.get("remote")
-            chunk_path = chunk.get("path")
-            expected_size = chunk.get("size")
-
-            # Check if chunk exists
-            exists = self._check_chunk_exists(
-                remote, chunk_path, expected_size if not quick else None
-            )
+            by_remote[chunk.get("remote")].append(chunk)
+
+        for remote, remote_chunks in by_remote.items():
+            existing = self._get_remote_listing(remote)
+
+            for chunk in remote_chunks:
+                chunk_index = chunk.get("index")
+                chunk_path = chunk.get("path")
+                expected_size = chunk.get("size")
+
+                if existing is not None:
+                    # Existence and size both come from the cached listing
+                    size = existing.get(chunk_path)
+                    exists = size is not None
+                    if exists and not quick and size != expected_size:
+                        log.warning(
+                            f"Size mismatch: expected {expected_size}, got {size}"
+                        )
+                        exists = False
+                else:
+                    # Listing failed, fall back to probing the chunk directly
+                    exists = self._check_chunk_exists(
+                        remote, chunk_path, expected_size if not quick else None
+                    )
 
-            if exists:
-                verified_chunks += 1
-                log.debug(f"  ✓ Chunk {chunk_index} exists on {remote}")
-            else:
-                missing_chunks.append(chunk_index)
-                log.warning(f"  ✗ Chunk {chunk_index} missing or corrupted on {remote}")
+                if exists:
+                    verified_chunks += 1
+                    log.debug(f"  ✓ Chunk {chunk_index} exists on {remote}")
+                else:
+                    missing_chunks.append(chunk_index)
+                    log.warning(
+                        f"  ✗ Chunk {chunk_index} missing or corrupted on {remote}"
+                    )
+                    if fail_fast:
+                        break
+
+            if fail_fast and missing_chunks:
+                break
+
+        missing_chunks = array("i", sorted(missing_chunks))
 
         if missing_chunks:
             status = "missing_chunks"
@@ -132,13 +297,19 @@ class Verifier:
         """
         log.info("Verifying all files in pool...")
 
-        manifests = self.manifest_mgr.list_manifests("/", recursive=True)
-        results = []
+        # Start from fresh listings, then reuse them for every file in the batch
+        self.invalidate_listing_cache()
 
-        for manifest in manifests:
-            file_path = manifest.get("file_path")
-            result = self.verify_file(file_path, quick=quick)
-            results.append(result)
+        manifests = self._list_all_manifests()
+
+        # Files are independent and latency-bound; results keep manifest order
+        results = []
+        if manifests:
+            workers = max(1, min(len(manifests), self.config.verify_workers or 8))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(
+                    executor.map(lambda m: self._verify_manifest(m, quick), manifests)
+                )
 
         # Summary
         total_files = len(results)
@@ -193,48 +364,83 @@ class Verifier:
 
         log.info(f"Re-uploading {len(result.missing_chunks)} missing chunks...")
 
-        # Re-upload missing chunks
+        # Re-upload missing chunks in offset order so the source is read
+        # sequentially through a single file handle
+        missing_chunks = sorted(
+            result.missing_chunks,
+            key=lambda i: manifest["chunks"][i].get("offset", 0),
+        )
+        # Uploads are network-bound and may target different remotes, so they
+        # run concurrently; at most one chunk per worker is in flight. Chunks
+        # are zero-copy slices of a read-only mapping of the source, so only
+        # the page cache holds their bytes.
         repaired_count = 0
-        for chunk_index in result.missing_chunks:
-            chunk_info = manifest["chunks"][chunk_index]
-            remote = chunk_info.get("remote")
-            chunk_path = chunk_info.get("path")
-            offset = chunk_info.get("offset")
-            size = chunk_info.get("size")
-
-            log.info(f"  Repairing chunk {chunk_index} -> {remote}")
-
-            # Read chunk data from local file
-            try:
-                with open(local_source_path, "rb") as f:
-                    f.seek(offset)
-                    chunk_data = f.read(size)
-
-                if len(chunk_data) != size:
-                    log.error(
-                        f"  Failed to read correct amount of data for chunk {chunk_index}"
-                    )
-                    continue
-
-                # Upload chunk
-                success = self.backend.upload_bytes(chunk_data, remote, chunk_path)
-                if success:
-                    log.info(f"  ✓ Chunk {chunk_index} repaired")
-                    repaired_count += 1
-                else:
-                    log.error(f"  ✗ Failed to upload chunk {chunk_index}")
+        workers = max(1, min(len(missing_chunks), self.config.repair_workers))
+        try:
+            with open(local_source_path, "rb") as f, mmap.mmap(
+                f.fileno(), 0, access=mmap.ACCESS_READ
+            ) as mm:
+                if hasattr(mm, "madvise"):
+                    mm.madvise(mmap.MADV_SEQUENTIAL)
+
+                source = memoryview(mm)
+                try:
+                    with ThreadPoolExecutor(max_workers=workers) as executor:
+                        uploads = {}
+                        for chunk_index in missing_chunks:
+                            chunk_info = manifest["chunks"][chunk_index]
+                            remote = chunk_info.get("remote")
+                            chunk_path = chunk_info.get("path")
+                            offset = chunk_info.get("offset")
+                            size = chunk_info.get("size")
+
+                            log.info(f"  Repairing chunk {chunk_index} -> {remote}")
+
+                            if offset + size > len(source):
+                                log.error(
+                                    f"  Failed to read correct amount of data for chunk {chunk_index}"
+                                )
+                                continue
+
+                            if len(uploads) >= workers:
+                                done, _ = wait(uploads, return_when=FIRST_COMPLETED)
+                                repaired_count += self._collect_repair_uploads(
+                                    done, uploads
+                                )
+
+                            # The slice is released by the upload task
+                            future = executor.submit(
+                                self._upload_chunk_view,
+                                source[offset : offset + size],
+                                remote,
+                                chunk_path,
+                            )
+                            uploads[future] = chunk_index
 
-            except IOError as e:
-                log.error(f"  Failed to read chunk {chunk_index} from local file: {e}")
-                continue
+                        repaired_count += self._collect_repair_uploads(
+                            as_completed(uploads), uploads
+                        )
+                finally:
+                    # The mapping cannot close while views of it are still
+                    # alive; release even if the loop raised, so the real
+                    # error is not replaced by a BufferError
+                    source.release()
+
+        except (IOError, ValueError) as e:
+            log.error(f"Failed to map local source {local_source_path}: {e}")
+            return False
 
         log.info(
             f"Repair complete: {repaired_count}/{len(result.missing_chunks)} chunks restored"
         )
 
-        # Verify again
-        log.info("Re-verifying file...")
-        final_result = self.verify_file(file_path)
+        # Listings predate the re-uploads
+        if repaired_count:
+            self.invalidate_listing_cache()
+
+        # Only the repaired chunks can have changed since the first pass
+        log.info("Re-verifying repaired chunks...")
+        final_result = self.verify_chunks(file_path, result.missing_chunks)
 
         if final_result.status == "ok":
             log.info("✓ File successfully repaired and verified")
@@ -254,48 +460,58 @@ class Verifier:
         """
         log.info("Scanning for orphaned chunks...")
 
-        # Get all chunk paths referenced in manifests
-        referenced_chunks: Set[Tuple[str, str]] = set()
-
-        manifests = self.manifest_mgr.list_manifests("/", recursive=True)
-        for manifest in manifests:
-            for chunk in manifest.get("chunks", []):
-                remote = chunk.get("remote")
-                path = chunk.get("path")
-                referenced_chunks.add((remote, path))
-
+        manifests = self._list_all_manifests()
+        referenced_count = sum(len(m.get("chunks", [])) for m in manifests)
         log.info(
-            f"  Found {len(referenced_chunks)} chunks referenced in {len(manifests)} manifests"
+            f"  Found {referenced_count} chunks referenced in {len(manifests)} manifests"
         )
 
-        # Scan all remotes for chunks
+        if referenced_count > self.config.orphan_bloom_threshold:
+            # A Bloom filter has no false negatives, so a referenced chunk is
+            # never reported; a false positive only hides an orphan, and the
+            # per-run salt makes a later run likely to catch it
+            bloom = BloomFilter(int(referenced_count * 1.2), error_rate=0.001)
+            for manifest in manifests:
+                for chunk in manifest.get("chunks", []):
+                    bloom.add(f"{chunk.get('remote')}|{chunk.get('path')}")
+
+            def is_referenced(remote: str, chunk_path: str) -> bool:
+                return f"{remote}|{chunk_path}" in bloom
+
+        else:
+            # Grouped by remote so lookups hash one path, not a (remote, path)
+            # tuple
+            referenced_chunks: Dict[str, Set[str]] = defaultdict(set)
+            for manifest in manifests:
+                for chunk in manifest.get("chunks", []):
+                    referenced_chunks[chunk.get("remote")].add(chunk.get("path"))
+
+            def is_referenced(remote: str, chunk_path: str) -> bool:
+                return chunk_path in referenced_chunks.get(remote, ())
+
+        # Scan all remotes for chunks; listings are fetched concurrently
+        log.info(f"  Scanning {len(self.config.remotes)} remotes...")
+        self._prefetch_remote_listings(self.config.remotes)
+
         orphans = []
 
         for remote in self.config.remotes:
-            log.info(f"  Scanning {remote}...")
+            chunk_sizes = self._get_remote_listing(remote)
+            if chunk_sizes is None:
+                log.error(f"  Error scanning {remote}")
+                continue
 
-            try:
-                files = self.backend.list_files(remote, self.config.data_prefix)
-                if not files:
-                    continue
-
-                for file_name in files:
-                    chunk_path = f"{self.config.data_prefix}/{file_name}"
-
-                    if (remote, chunk_path) not in referenced_chunks:
-                        # This is an orphan
-                        log.warning(f"  Found orphan: {remote}{chunk_path}")
-                        orphans.append(
-                            OrphanChunk(
-                                remote=remote,
-                                path=chunk_path,
-                                size=0,  # We could get actual size if needed
-                            )
+            for chunk_path in sorted(chunk_sizes):
+                if not is_referenced(remote, chunk_path):
+                    # This is an orphan
+                    log.warning(f"  Found orphan: {remote}{chunk_path}")
+                    orphans.append(
+                        OrphanChunk(
+                            remote=remote,
+                            path=chunk_path,
+                            size=chunk_sizes[chunk_path],
                         )
-
-            except Exception as e:
-                log.error(f"  Error scanning {remote}: {e}")
-                continue
+                    )
 
         log.info(f"\nFound {len(orphans)} orphaned chunks")
 
@@ -334,21 +550,269 @@ class Verifier:
                 log.info("Deletion cancelled")
                 return 0
 
-        deleted_count = 0
+        # One rclone call per remote rather than one per orphan
+        by_remote: Dict[str, List[OrphanChunk]] = defaultdict(list)
         for orphan in orphans:
+            by_remote[orphan.remote].append(orphan)
+
+        deleted_count = 0
+        for remote, remote_orphans in by_remote.items():
             try:
-                success = self.backend.delete_file(orphan.remote, orphan.path)
-                if success:
+                deleted = set(
+                    self.backend.delete_files_batch(
+                        remote, [orphan.path for orphan in remote_orphans]
+                    )
+                )
+            except Exception as e:
+                log.error(f"  Error deleting orphans on {remote}: {e}")
+                continue
+
+            for orphan in remote_orphans:
+                if orphan.path in deleted:
                     log.info(f"  ✓ Deleted {orphan.remote}{orphan.path}")
                     deleted_count += 1
                 else:
                     log.error(f"  ✗ Failed to delete {orphan.remote}{orphan.path}")
-            except Exception as e:
-                log.error(f"  Error deleting {orphan.remote}{orphan.path}: {e}")
+
+        # Listings cached by find_orphans still contain the deleted chunks
+        if deleted_count:
+            self.invalidate_listing_cache()
 
         log.info(f"\nDeleted {deleted_count}/{len(orphans)} orphaned chunks")
         return deleted_count
 
+    def _list_all_manifests(self) -> List[dict]:
+        """
+        List every manifest in the pool, reusing the on-disk manifest index.
+
+        Only manifests whose modification time changed since the last run are
+        downloaded again; the rest come from the index.
+
+        Returns:
+            List of manifest dicts
+        """
+        if not self.config.enable_manifest_cache:
+            return self.manifest_mgr.list_manifests(
+                "/", recursive=True, workers=self.config.verify_workers
+            )
+
+        index = self._load_manifest_index()
+
+        for remote in self.config.remotes:
+            try:
+                mtimes = self.backend.list_files_with_mtimes(
+                    remote, self.config.manifest_prefix
+                )
+            except Exception as e:
+                log.debug(f"Error listing manifests on {remote}: {e}")
+                continue
+
+            if not mtimes:
+                continue
+
+            # Modification times are per remote, so entries from another
+            # remote cannot be reused
+            cached = index["manifests"] if index.get("remote") == remote else {}
+            names = [name for name in mtimes if name.endswith(".manifest.json")]
+            stale = [
+                name
+                for name in names
+                if name not in cached or cached[name]["mtime"] != mtimes[name]
+            ]
+
+            # Changed manifests are small and latency-bound; fetch concurrently
+            def fetch(name):
+                return name, self.manifest_mgr.download_manifest(remote, name)
+
+            downloaded = {}
+            if stale:
+                workers = max(1, min(len(stale), self.config.verify_workers or 8))
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    downloaded = dict(executor.map(fetch, stale))
+
+            entries = {}
+            for name in names:
+                if name not in downloaded:
+                    entries[name] = cached[name]
+                elif downloaded[name] is not None:
+                    entries[name] = {
+                        "mtime": mtimes[name],
+                        "manifest": downloaded[name],
+                    }
+            fetched = sum(1 for manifest in downloaded.values() if manifest is not None)
+
+            if not entries:
+                continue
+
+            log.info(
+                f"  Loaded {len(entries)} manifests ({fetched} fetched from {remote})"
+            )
+            if fetched or len(entries) != len(cached):
+                self._save_manifest_index({"remote": remote, "manifests": entries})
+
+            return [entry["manifest"] for entry in entries.values()]
+
+        return []
+
+    def _manifest_index_file(self) -> str:
+        """Path of the on-disk manifest index used by verify and orphans."""
+        cache_dir = os.path.expanduser(self.config.manifest_cache_dir)
+        return os.path.join(cache_dir, "verifier_cache.marshal")
+
+    def _load_manifest_index(self) -> dict:
+        """
+        Load the manifest index saved by a previous run.
+
+        Returns:
+            Dict with the listed remote and {manifest name: {mtime, manifest}}
+        """
+        empty = {"remote": None, "manifests": {}}
+        index_file = self._manifest_index_file()
+        if not os.path.exists(index_file):
+            return empty
+
+        try:
+            with open(index_file, "rb") as f:
+                index = marshal.load(f)
+        except (EOFError, ValueError, TypeError, IOError) as e:
+            log.warning(f"Failed to load manifest index: {e}, starting fresh")
+            return empty
+
+        # The marshal format is only guaranteed within one Python version
+        if not isinstance(index, dict) or index.get("tag") != _MANIFEST_INDEX_TAG:
+            return empty
+        return index
+
+    def _save_manifest_index(self, index: dict):
+        """
+        Save the manifest index for the next run.
+
+        Args:
+            index: Dict with the listed remote and its manifest entries
+        """
+        index_file = self._manifest_index_file()
+        try:
+            os.makedirs(os.path.dirname(index_file), exist_ok=True)
+
+            # Write to temp file first, then rename (atomic operation)
+            temp_file = index_file + ".tmp"
+            with open(temp_file, "wb") as f:
+                marshal.dump({"tag": _MANIFEST_INDEX_TAG, **index}, f)
+
+            os.replace(temp_file, index_file)
+        except (ValueError, IOError) as e:
+            log.warning(f"Failed to save manifest index: {e}")
+
+    def invalidate_listing_cache(self):
+        """Drop cached remote listings so the next lookup lists remotes again."""
+        self._remote_listing_cache.clear()
+
+    def _prefetch_remote_listings(self, remotes: List[str]):
+        """
+        List any uncached remotes concurrently to fill the listing cache.
+
+        Args:
+            remotes: Remote names to list
+        """
+        pending = [r for r in remotes if r not in self._remote_listing_cache]
+        if not pending:
+            return
+
+        with ThreadPoolExecutor(max_workers=min(len(pending), 8)) as executor:
+            futures = {
+                executor.submit(self._get_remote_listing, remote): remote
+                for remote in pending
+            }
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    log.error(f"  Error scanning {futures[future]}: {e}")
+
+    def _upload_chunk_view(
+        self, chunk_data: memoryview, remote: str, chunk_path: str
+    ) -> bool:
+        """
+        Upload a chunk sliced from the mapped source, then release the slice.
+
+        Args:
+            chunk_data: View of the chunk's bytes in the source mapping
+            remote: Target remote
+            chunk_path: Chunk path on the remote
+
+        Returns:
+            True if the upload succeeded
+        """
+        try:
+            return self.backend.upload_bytes(chunk_data, remote, chunk_path)
+        finally:
+            chunk_data.release()
+
+    def _collect_repair_uploads(self, done, uploads: Dict[Future, int]) -> int:
+        """
+        Log finished chunk uploads and remove them from the in-flight set.
+
+        Args:
+            done: Iterable of completed upload futures
+            uploads: In-flight upload futures -> chunk index
+
+        Returns:
+            Number of chunks uploaded successfully
+        """
+        repaired = 0
+        for future in done:
+            chunk_index = uploads.pop(future)
+            try:
+                success = future.result()
+            except Exception as e:
+                log.error(f"  ✗ Failed to upload chunk {chunk_index}: {e}")
+                continue
+
+            if success:
+                log.info(f"  ✓ Chunk {chunk_index} repaired")
+                repaired += 1
+            else:
+                log.error(f"  ✗ Failed to upload chunk {chunk_index}")
+
+        return repaired
+
+    def _get_remote_listing(self, remote: str) -> Optional[Dict[str, int]]:
+        """
+        Get the chunk paths present on a remote and their sizes, listing it once.
+
+        Args:
+            remote: Remote name
+
+        Returns:
+            Dict of chunk path -> size, or None if the remote could not be listed
+        """
+        if remote in self._remote_listing_cache:
+            return self._remote_listing_cache[remote]
+
+        # One lock per remote so concurrent verifications list it only once
+        with self._listing_locks_guard:
+            lock = self._listing_locks.setdefault(remote, threading.Lock())
+
+        with lock:
+            if remote not in self._remote_listing_cache:
+                try:
+                    files = self.backend.list_files_with_sizes(
+                        remote, self.config.data_prefix
+                    )
+                except Exception as e:
+                    log.debug(f"Error listing {remote}: {e}")
+                    files = None
+
+                if files is None:
+                    self._remote_listing_cache[remote] = None
+                else:
+                    self._remote_listing_cache[remote] = {
+                        f"{self.config.data_prefix}/{file_name}": size
+                        for file_name, size in files.items()
+                    }
+
+            return self._remote_listing_cache[remote]
+
     def _check_chunk_exists(
         self, remote: str, chunk_path: str, expected_size: Optional[int] = None
     ) -> bool:
@@ -364,24 +828,17 @@ class Verifier:
             True if chunk exists (and size matches if specified)
         """
         try:
-            # Try to download just 1 byte to check existence
-            data = self.backend.download_byte_range(remote, chunk_path, 0, 1)
+            # One metadata call answers both existence and size
+            info = self.backend.stat(remote, chunk_path)
 
-            if data is None:
+            if info is None:
                 return False
 
-            # If size check requested, download full chunk
-            if expected_size is not None:
-                full_data = self.backend.download_bytes(
-                    remote, chunk_path, suppress_errors=True
+            if expected_size is not None and info.get("Size") != expected_size:
+                log.warning(
+                    f"Size mismatch: expected {expected_size}, got {info.get('Size')}"
                 )
-                if full_data is None:
-                    return False
-                if len(full_data) != expected_size:
-                    log.warning(
-                        f"Size mismatch: expected {expected_size}, got {len(full_data)}"
-                    )
-                    return False
+                return False
 
             return True
 
@@ -401,6 +858,9 @@ class DuplicateDetector:
             manifest_mgr: ManifestManager instance
         """
         self.manifest_mgr = manifest_mgr
+        # file path -> file size for every manifest, built on first lookup
+        self._index: Optional[Dict[str, int]] = None
+        self._index_lock = threading.Lock()
 
     def find_duplicate(
         self, file_name: str, file_size: int, remote_dir: str = "/"
@@ -418,6 +878,10 @@ class DuplicateDetector:
         """
         file_path = f"{remote_dir.rstrip('/')}/{file_name}"
 
+        # Only fetch the manifest when the index says a same-sized file exists
+        if self._get_index().get(file_path) != file_size:
+            return None
+
         manifest = self.manifest_mgr.load_manifest_for_file(file_path)
 
         if manifest and manifest.get("file_size") == file_size:
@@ -426,6 +890,26 @@ class DuplicateDetector:
 
         return None
 
+    def invalidate(self):
+        """Drop the file index so the next lookup rebuilds it from the manifests."""
+        self._index = None
+
+    def _get_index(self) -> Dict[str, int]:
+        """
+        Get the file path -> size index, listing manifests once to build it.
+
+        Returns:
+            Dict of file path -> file size
+        """
+        with self._index_lock:
+            if self._index is None:
+                manifests = self.manifest_mgr.list_manifests("/", recursive=True)
+                self._index = {
+                    manifest.get("file_path"): manifest.get("file_size")
+                    for manifest in manifests
+                }
+            return self._index
+
     def check_content_hash(self, local_path: str, manifest: dict) -> bool:
         """
         Check if a local file matches an existing manifest by comparing checksums.
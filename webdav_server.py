@@ -12,23 +12,254 @@ This allows you to:
 
 import os
 import io
+import functools
+import html
+import itertools
 import logging
+import queue
+import re
 import threading
 import time
+import shutil
 import signal
+import socket
 import sys
+import tempfile
 from http.server import HTTPServer, BaseHTTPRequestHandler
 from socketserver import ThreadingMixIn
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import unquote, quote
 import xml.etree.ElementTree as ET
 
+from cache import TTLCache
+
 log = logging.getLogger('rclonepool')
 
+# Single byte range: "bytes=first-[last]" or suffix "bytes=-length"
+_RANGE_RE = re.compile(r'bytes=(?:(\d+)-(\d*)|-(\d+))$')
+
+# Distinguishes a cached "no manifest" (None) from a cache miss
+_MISSING = object()
+
+_MULTISTATUS_HEAD = b'<?xml version="1.0" encoding="utf-8"?>\n<D:multistatus xmlns:D="DAV:">\n'
+_MULTISTATUS_TAIL = b'</D:multistatus>'
+# One PROPFIND D:response each: %(href, lastmodified) and
+# %(href, contentlength, contenttype, lastmodified)
+_RESPONSE_HEAD = b'  <D:response>\n    <D:href>%s</D:href>\n    <D:propstat>\n      <D:prop>\n        '
+_RESPONSE_TAIL = (b'</D:getlastmodified>\n      </D:prop>\n'
+                  b'      <D:status>HTTP/1.1 200 OK</D:status>\n'
+                  b'    </D:propstat>\n  </D:response>\n')
+_DIR_RESPONSE = (_RESPONSE_HEAD
+                 + b'<D:resourcetype><D:collection/></D:resourcetype>\n'
+                 + b'        <D:getlastmodified>%s' + _RESPONSE_TAIL)
+_FILE_RESPONSE = (_RESPONSE_HEAD
+                  + b'<D:resourcetype/>\n        <D:getcontentlength>%d</D:getcontentlength>\n'
+                  + b'        <D:getcontenttype>%s</D:getcontenttype>\n'
+                  + b'        <D:getlastmodified>%s' + _RESPONSE_TAIL)
+# Seconds serve_forever waits for a connection before checking for shutdown
+_POLL_INTERVAL = 0.05
+
+# Sent without reading the request when every worker and queue slot is taken
+_BUSY_RESPONSE = (b'HTTP/1.0 503 Service Unavailable\r\n'
+                  b'Retry-After: 1\r\nContent-Length: 0\r\nConnection: close\r\n\r\n')
+
+# Bytes of rendered PROPFIND responses collected before each streamed write
+_STREAM_BATCH = 64 * 1024
+
+_CT_MAP = {
+    '.mp4': 'video/mp4',
+    '.mkv': 'video/x-matroska',
+    '.avi': 'video/x-msvideo',
+    '.mov': 'video/quicktime',
+    '.webm': 'video/webm',
+    '.flv': 'video/x-flv',
+    '.m4v': 'video/mp4',
+    '.ts': 'video/mp2t',
+    '.mp3': 'audio/mpeg',
+    '.flac': 'audio/flac',
+    '.wav': 'audio/wav',
+    '.aac': 'audio/aac',
+    '.ogg': 'audio/ogg',
+    '.m4a': 'audio/mp4',
+    '.jpg': 'image/jpeg',
+    '.jpeg': 'image/jpeg',
+    '.png': 'image/png',
+    '.gif': 'image/gif',
+    '.webp': 'image/webp',
+    '.pdf': 'application/pdf',
+    '.zip': 'application/zip',
+    '.rar': 'application/x-rar-compressed',
+    '.7z': 'application/x-7z-compressed',
+    '.tar': 'application/x-tar',
+    '.gz': 'application/gzip',
+    '.txt': 'text/plain',
+    '.json': 'application/json',
+    '.xml': 'application/xml',
+    '.html': 'text/html',
+    '.srt': 'text/plain',
+    '.ass': 'text/plain',
+    '.sub': 'text/plain',
+    '.iso': 'application/x-iso9660-image',
+    '.img': 'application/octet-stream',
+}
+
+_CT_MAP_B = {ext: ct.encode() for ext, ct in _CT_MAP.items()}
+
+
+# Directory listing page; %(path)s must already be HTML-escaped
+_HTML_HEAD = """<!DOCTYPE html>
+<html>
+<head><title>rclonepool — %(path)s</title>
+<style>
+    body { font-family: monospace; padding: 20px; background: #1a1a2e; color: #eee; }
+    a { color: #4fc3f7; text-decoration: none; }
+    a:hover { text-decoration: underline; }
+    table { border-collapse: collapse; width: 100%%; }
+    th, td { text-align: left; padding: 8px 16px; border-bottom: 1px solid #333; }
+    th { color: #aaa; }
+    .size { text-align: right; }
+    h2 { color: #4fc3f7; }
+    .dir { color: #ffd700; }
+</style>
+</head>
+<body>
+<h2>📦 rclonepool — %(path)s</h2>
+<table>
+<tr><th>Name</th><th class="size">Size</th><th>Chunks</th><th>Remotes</th></tr>
+"""
+_PARENT_ROW = '<tr><td><a href="{href}">⬆️ ..</a></td><td></td><td></td><td></td></tr>\n'
+_DIR_ROW = ('<tr><td class="dir"><a href="{href}">📁 {name}/</a></td>'
+            '<td class="size">—</td><td>—</td><td>—</td></tr>\n')
+_FILE_ROW = ('<tr><td><a href="{href}">{name}</a></td><td class="size">{size}</td>'
+             '<td>{chunks}</td><td>{remotes}</td></tr>\n')
+_HTML_FOOT = """</table>
+<hr>
+<p>rclonepool WebDAV server · <a href="/">home</a></p>
+</body></html>"""
+
+
+@functools.lru_cache(maxsize=4096)
+def _http_date(seconds: int) -> str:
+    return time.strftime('%a, %d %b %Y %H:%M:%S GMT', time.gmtime(seconds))
+
+
+@functools.lru_cache(maxsize=4096)
+def _http_date_b(seconds: int) -> bytes:
+    return _http_date(seconds).encode('ascii')
+
+
+def _discard_prefetch(budget, reserved: int, future):
+    """Done-callback for a prefetched chunk that will never be sent."""
+    budget.release(reserved)
+    if not future.cancelled() and future.exception() is None:
+        data = future.result()
+        if hasattr(data, 'close'):
+            data.close()
+
+
+class _ByteBudget:
+    """Bytes that may be reserved at once across threads; reservations never wait."""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._used = 0
+        self._lock = threading.Lock()
+
+    def try_acquire(self, n: int) -> bool:
+        with self._lock:
+            if self._used + n > self.max_bytes:
+                return False
+            self._used += n
+            return True
+
+    def release(self, n: int):
+        with self._lock:
+            self._used -= n
 
-class ThreadedHTTPServer(ThreadingMixIn, HTTPServer):
-    """Handle requests in a separate thread for concurrency."""
-    daemon_threads = True
+
+class PooledMixIn(ThreadingMixIn):
+    """Handle requests on a fixed pool of worker threads instead of one new thread each.
+
+    Accepted connections wait in a bounded queue for a free worker; once it
+    is full, new ones get an immediate 503 so the accept loop never blocks.
+    Workers are daemon threads, so closing the server (or exiting) never
+    waits on a connected client.
+    """
+
+    def __init__(self, *args, max_workers: int = 16, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._pending = queue.Queue(maxsize=max_workers)
+        self._workers = [threading.Thread(target=self._work, name=f'webdav-{i}', daemon=True)
+                         for i in range(max_workers)]
+        for worker in self._workers:
+            worker.start()
+
+    def _work(self):
+        while True:
+            item = self._pending.get()
+            if item is None:
+                return
+            self.process_request_thread(*item)
+
+    def process_request(self, request, client_address):
+        try:
+            self._pending.put_nowait((request, client_address))
+        except queue.Full:
+            log.warning(f"WebDAV busy, rejecting connection from {client_address[0]}")
+            try:
+                request.sendall(_BUSY_RESPONSE)
+            except OSError:
+                pass
+            self.shutdown_request(request)
+
+    def server_close(self):
+        HTTPServer.server_close(self)
+        # Drop connections no worker has picked up, then wake idle workers
+        while True:
+            try:
+                item = self._pending.get_nowait()
+            except queue.Empty:
+                break
+            if item is not None:
+                self.shutdown_request(item[0])
+        for _ in self._workers:
+            try:
+                self._pending.put_nowait(None)
+            except queue.Full:
+                break
+
+
+class StopServing(Exception):
+    """Raised out of serve_forever() once request_shutdown() has been called."""
+
+
+class ThreadedHTTPServer(PooledMixIn, HTTPServer):
+    """Handle requests concurrently on a bounded worker pool."""
     allow_reuse_address = True
+    _shutdown_requested = False
+
+    def request_shutdown(self):
+        """Stop serve_forever() within one poll interval.
+
+        Unlike shutdown(), this is safe to call from the thread running
+        serve_forever(), such as a signal handler on the main thread.
+        """
+        self._shutdown_requested = True
+
+    def service_actions(self):
+        super().service_actions()
+        if self._shutdown_requested:
+            raise StopServing
+
+    def handle_error(self, request, client_address):
+        # Buffered responses can hit a closed connection on the final flush
+        if isinstance(sys.exc_info()[1], (BrokenPipeError, ConnectionResetError)):
+            log.debug(f"Client {client_address[0]} disconnected")
+            return
+        if isinstance(sys.exc_info()[1], TimeoutError):
+            log.debug(f"Client {client_address[0]} timed out")
+            return
+        super().handle_error(request, client_address)
 
 
 class WebDAVHandler(BaseHTTPRequestHandler):
@@ -44,9 +275,50 @@ class WebDAVHandler(BaseHTTPRequestHandler):
     - MOVE (rename/move files)
     """
 
-    pool = None  # Set by RclonePoolDAVServer
+    pool = None  # Set by configure()
+    _manifest_cache = None  # path -> manifest or None
+    _listing_cache = None  # (path, recursive) -> list of manifests
+    _snapshot = None  # (expires, ManifestSnapshot) shared by all requests
+    _snapshot_lock = None
+    _rejected_uploads = itertools.count(1)  # next() is atomic, so shared safely
+    _prefetcher = None  # Executor for GET downloads ahead, shared by all requests
+    _prefetch_budget = None  # Caps bytes downloaded ahead across all requests
     server_version = "rclonepool/1.0"
 
+    # Streaming socket tuning: no Nagle delay, a deep kernel send queue, and a
+    # write buffer so headers and small bodies go out in one send()
+    disable_nagle_algorithm = True
+    wbufsize = 256 * 1024
+    sndbuf = 4 * 1024 * 1024
+
+    @classmethod
+    def configure(cls, pool):
+        """Attach the pool and fresh manifest lookup caches to this handler class."""
+        cls.pool = pool
+        # Idle or stalled clients give their worker back after this long
+        cls.timeout = pool.config.webdav_timeout
+        ttl = pool.config.webdav_cache_ttl
+        cls._manifest_cache = TTLCache(maxsize=4096, ttl=ttl)
+        cls._listing_cache = TTLCache(maxsize=1024, ttl=ttl)
+        cls._snapshot = None
+        cls._snapshot_lock = threading.Lock()
+        cls.close()
+        cls._prefetcher = ThreadPoolExecutor(max_workers=pool.config.max_parallel_workers,
+                                             thread_name_prefix='webdav-prefetch')
+        cls._prefetch_budget = _ByteBudget(pool.config.prefetch_max_mb * 1024 * 1024)
+
+    @classmethod
+    def close(cls):
+        """Cancel downloads ahead that have not started; call once serving stops."""
+        # Only this class's own executor, never one inherited from a parent
+        prefetcher = vars(cls).get('_prefetcher')
+        if prefetcher is not None:
+            prefetcher.shutdown(wait=False, cancel_futures=True)
+
+    def setup(self):
+        super().setup()
+        self.connection.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, self.sndbuf)
+
     def log_message(self, format, *args):
         log.debug(f"WebDAV: {format % args}")
 
@@ -76,7 +348,9 @@ class WebDAVHandler(BaseHTTPRequestHandler):
             self.end_headers()
             return
 
-        manifest = self.pool.manifest_mgr.load_manifest_for_file(path)
+        # Answered from memory; see _manifest_snapshot for freshness
+        snapshot = self._manifest_snapshot()
+        manifest = snapshot.by_path.get(path)
         if manifest:
             self.send_response(200)
             self.send_header('Content-Type', self._guess_content_type(path))
@@ -84,15 +358,12 @@ class WebDAVHandler(BaseHTTPRequestHandler):
             self.send_header('Accept-Ranges', 'bytes')
             self.send_header('Last-Modified', self._format_time(manifest.get('created_at', 0)))
             self.end_headers()
+        elif path in snapshot.dirs:
+            self.send_response(200)
+            self.send_header('Content-Type', 'httpd/unix-directory')
+            self.end_headers()
         else:
-            # Check if it's a directory
-            manifests = self.pool.manifest_mgr.list_manifests(path)
-            if manifests:
-                self.send_response(200)
-                self.send_header('Content-Type', 'httpd/unix-directory')
-                self.end_headers()
-            else:
-                self._safe_send_error(404, 'Not Found')
+            self._safe_send_error(404, 'Not Found')
 
     # ─── GET (with Range support for video streaming) ─────
     def do_GET(self):
@@ -109,10 +380,10 @@ class WebDAVHandler(BaseHTTPRequestHandler):
             self._send_directory_listing('/')
             return
 
-        manifest = self.pool.manifest_mgr.load_manifest_for_file(path)
+        manifest = self._cached_manifest(path)
         if not manifest:
             # Maybe it's a directory
-            manifests = self.pool.manifest_mgr.list_manifests(path)
+            manifests = self._cached_list(path)
             if manifests:
                 self._send_directory_listing(path)
                 return
@@ -123,47 +394,42 @@ class WebDAVHandler(BaseHTTPRequestHandler):
         range_header = self.headers.get('Range')
 
         if range_header:
-            try:
-                range_spec = range_header.replace('bytes=', '').strip()
-
-                if range_spec.startswith('-'):
-                    suffix_len = int(range_spec[1:])
-                    start = max(0, file_size - suffix_len)
-                    end = file_size - 1
-                elif range_spec.endswith('-'):
-                    start = int(range_spec[:-1])
-                    end = file_size - 1
-                else:
-                    parts = range_spec.split('-')
-                    start = int(parts[0])
-                    end = int(parts[1])
-
-                # Clamp
-                end = min(end, file_size - 1)
-                length = end - start + 1
-
-                if start >= file_size or start < 0 or length <= 0:
-                    self.send_response(416)
-                    self.send_header('Content-Range', f'bytes */{file_size}')
-                    self.end_headers()
-                    return
-
-                data = self.pool.download_range(path, start, length)
-                if data is None:
-                    self._safe_send_error(500, 'Failed to read range')
-                    return
-
-                self.send_response(206)
-                self.send_header('Content-Type', self._guess_content_type(path))
-                self.send_header('Content-Range', f'bytes {start}-{end}/{file_size}')
-                self.send_header('Content-Length', str(len(data)))
-                self.send_header('Accept-Ranges', 'bytes')
+            m = _RANGE_RE.match(range_header.strip())
+            if not m:
+                log.error(f"Invalid Range header: {range_header}")
+                self._safe_send_error(416, 'Range Not Satisfiable')
+                return
+
+            first, last, suffix = m.groups()
+            if suffix is not None:
+                start = max(0, file_size - int(suffix))
+                end = file_size - 1
+            else:
+                start = int(first)
+                end = int(last) if last else file_size - 1
+
+            # Clamp
+            end = min(end, file_size - 1)
+            length = end - start + 1
+
+            if start >= file_size or length <= 0:
+                self.send_response(416)
+                self.send_header('Content-Range', f'bytes */{file_size}')
                 self.end_headers()
-                self.wfile.write(data)
+                return
 
-            except (ValueError, IndexError) as e:
-                log.error(f"Invalid Range header: {range_header} — {e}")
-                self._safe_send_error(416, 'Range Not Satisfiable')
+            data = self.pool.download_range(path, start, length)
+            if data is None:
+                self._safe_send_error(500, 'Failed to read range')
+                return
+
+            self.send_response(206)
+            self.send_header('Content-Type', self._guess_content_type(path))
+            self.send_header('Content-Range', f'bytes {start}-{end}/{file_size}')
+            self.send_header('Content-Length', str(len(data)))
+            self.send_header('Accept-Ranges', 'bytes')
+            self.end_headers()
+            self.wfile.write(data)
         else:
             # Full file download — stream chunk by chunk
             self.send_response(200)
@@ -172,58 +438,74 @@ class WebDAVHandler(BaseHTTPRequestHandler):
             self.send_header('Accept-Ranges', 'bytes')
             self.end_headers()
 
-            for chunk in sorted(manifest['chunks'], key=lambda c: c['index']):
-                try:
-                    data = self.pool.backend.download_bytes(chunk['remote'], chunk['path'])
-                    if data is None:
-                        log.error(f"Failed to download chunk {chunk['index']}")
-                        break
-                    self.wfile.write(data)
-                    self.wfile.flush()
-                except (BrokenPipeError, ConnectionResetError):
-                    log.debug("Client disconnected during download")
-                    break
+            self._send_chunks(manifest['chunks'])
 
     # ─── PUT (upload) ──────────────────────────────────────
     def do_PUT(self):
         path = unquote(self.path)
-        content_length = int(self.headers.get('Content-Length', 0))
+        config = self.pool.config
+        try:
+            content_length = int(self.headers.get('Content-Length', 0))
+        except ValueError:
+            content_length = -1
+        if content_length < 0:
+            self._reject_upload(path, 400, 'Invalid Content-Length')
+            return
 
         if content_length == 0:
             self._safe_send_error(411, 'Length Required')
             return
 
+        if config.max_upload_size and content_length > config.max_upload_size:
+            self._reject_upload(path, 413, 'Payload Too Large')
+            return
+
+        # Staging needs the whole body in temp_dir; streaming one chunk at a time
+        temp_dir = config.temp_dir
+        os.makedirs(temp_dir, exist_ok=True)
+        needed = content_length if not config.stream_uploads else min(content_length, config.chunk_size)
+        if needed > shutil.disk_usage(temp_dir).free - config.min_free_disk:
+            self._reject_upload(path, 507, 'Insufficient Storage')
+            return
+
         log.info(f"WebDAV PUT: {path} ({content_length} bytes)")
 
-        temp_path = os.path.join(
-            self.pool.config.temp_dir,
-            f"webdav_upload_{os.getpid()}_{threading.current_thread().ident}.tmp"
-        )
+        if config.stream_uploads:
+            success = self.pool.upload_stream(self.rfile, content_length, path)
+            self._invalidate(path)
+            self._send_put_result(success)
+            return
 
-        try:
-            os.makedirs(os.path.dirname(temp_path), exist_ok=True)
-            with open(temp_path, 'wb') as f:
-                remaining = content_length
-                while remaining > 0:
-                    read_size = min(remaining, 8 * 1024 * 1024)
-                    chunk = self.rfile.read(read_size)
-                    if not chunk:
-                        break
-                    f.write(chunk)
-                    remaining -= len(chunk)
+        buf = memoryview(bytearray(min(content_length, config.put_read_size)))
 
-            success = self.pool.upload(temp_path, path)
-            if success:
-                self.send_response(201)
-                self.send_header('Content-Length', '0')
-                self.end_headers()
-            else:
-                self._safe_send_error(500, 'Upload failed')
-        finally:
-            try:
-                os.remove(temp_path)
-            except OSError:
-                pass
+        # Unique per request and removed on close, even if upload raises
+        with tempfile.NamedTemporaryFile(dir=temp_dir, prefix='webdav_put_', suffix='.tmp') as f:
+            remaining = content_length
+            while remaining > 0:
+                n = self.rfile.readinto(buf[:min(remaining, len(buf))])
+                if not n:
+                    break
+                f.write(buf[:n])
+                remaining -= n
+            f.flush()
+
+            success = self.pool.upload(f.name, path)
+
+        self._invalidate(path)
+        self._send_put_result(success)
+
+    def _reject_upload(self, path: str, code: int, message: str):
+        rejected = next(self._rejected_uploads)
+        log.warning(f"WebDAV PUT rejected: {path} — {code} {message} ({rejected} rejected so far)")
+        self._safe_send_error(code, message)
+
+    def _send_put_result(self, success: bool):
+        if success:
+            self.send_response(201)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+        else:
+            self._safe_send_error(500, 'Upload failed')
 
     # ─── DELETE ────────────────────────────────────────────
     def do_DELETE(self):
@@ -231,6 +513,7 @@ class WebDAVHandler(BaseHTTPRequestHandler):
         log.info(f"WebDAV DELETE: {path}")
 
         success = self.pool.delete(path)
+        self._invalidate(path)
         if success:
             self.send_response(204)
             self.end_headers()
@@ -240,6 +523,7 @@ class WebDAVHandler(BaseHTTPRequestHandler):
     # ─── MKCOL ─────────────────────────────────────────────
     def do_MKCOL(self):
         # Virtual directories — always succeed
+        self._invalidate(unquote(self.path))
         self.send_response(201)
         self.send_header('Content-Length', '0')
         self.end_headers()
@@ -260,23 +544,11 @@ class WebDAVHandler(BaseHTTPRequestHandler):
 
         log.info(f"WebDAV MOVE: {src_path} -> {dest_path}")
 
-        manifest = self.pool.manifest_mgr.load_manifest_for_file(src_path)
-        if not manifest:
+        if not self.pool.manifest_mgr.rename_manifest(src_path, dest_path):
             self._safe_send_error(404, 'Source not found')
             return
 
-        # Update manifest with new path
-        dest_name = dest_path.rstrip('/').split('/')[-1]
-        dest_dir = '/'.join(dest_path.rstrip('/').split('/')[:-1]) or '/'
-
-        # Delete old manifest
-        self.pool.manifest_mgr.delete_manifest(src_path)
-
-        # Update and save new manifest
-        manifest['file_name'] = dest_name
-        manifest['remote_dir'] = dest_dir
-        manifest['file_path'] = dest_path
-        self.pool.manifest_mgr.save_manifest(manifest)
+        self._invalidate(src_path, dest_path)
 
         self.send_response(201)
         self.send_header('Content-Length', '0')
@@ -300,69 +572,17 @@ class WebDAVHandler(BaseHTTPRequestHandler):
         if content_length > 0:
             self.rfile.read(content_length)
 
-        responses = []
-
-        if path == '/':
-            responses.append(self._propfind_dir_response('/'))
-
-            if depth != '0':
-                manifests = self.pool.manifest_mgr.list_manifests('/', recursive=True)
-                dirs = set()
-                for m in manifests:
-                    rd = m.get('remote_dir', '/')
-                    if rd != '/':
-                        parts = rd.strip('/').split('/')
-                        if parts[0]:
-                            dirs.add('/' + parts[0])
-
-                for d in sorted(dirs):
-                    responses.append(self._propfind_dir_response(d))
-
-                for m in manifests:
-                    if m.get('remote_dir', '/') == '/':
-                        responses.append(self._propfind_file_response(
-                            m['file_path'], m['file_size'], m.get('created_at', 0)
-                        ))
-        else:
-            manifest = self.pool.manifest_mgr.load_manifest_for_file(path)
-            if manifest:
-                responses.append(self._propfind_file_response(
-                    path, manifest['file_size'], manifest.get('created_at', 0)
-                ))
-            else:
-                manifests = self.pool.manifest_mgr.list_manifests(path, recursive=True)
-                if manifests:
-                    responses.append(self._propfind_dir_response(path))
-                    if depth != '0':
-                        # Find subdirectories within this directory
-                        subdirs = set()
-                        for m in manifests:
-                            rd = m.get('remote_dir', '/')
-                            # Check if this file is in a subdirectory of current path
-                            if rd != path and rd.startswith(path.rstrip('/') + '/'):
-                                # Extract the immediate subdirectory name
-                                remaining = rd[len(path.rstrip('/') + '/'):]
-                                subdir_name = remaining.split('/')[0]
-                                if subdir_name:
-                                    subdirs.add(path.rstrip('/') + '/' + subdir_name)
-                        
-                        # Add subdirectory responses
-                        for subdir in sorted(subdirs):
-                            responses.append(self._propfind_dir_response(subdir))
-                        
-                        # Add file responses (files directly in this directory only)
-                        for m in manifests:
-                            if m.get('remote_dir', '/') == path:
-                                responses.append(self._propfind_file_response(
-                                    m['file_path'], m['file_size'], m.get('created_at', 0)
-                                ))
-                else:
-                    self._safe_send_error(404, 'Not Found')
-                    return
-
-        xml = self._build_multistatus(responses)
+        rows = self._propfind_rows(path, depth)
+        if rows is None:
+            self._safe_send_error(404, 'Not Found')
+            return
 
         try:
+            if self.pool.config.propfind_chunked:
+                self._send_multistatus_streamed(rows)
+                return
+
+            xml = self._build_multistatus(rows)
             self.send_response(207)
             self.send_header('Content-Type', 'application/xml; charset=utf-8')
             self.send_header('Content-Length', str(len(xml)))
@@ -371,58 +591,225 @@ class WebDAVHandler(BaseHTTPRequestHandler):
         except (BrokenPipeError, ConnectionResetError):
             log.debug("Client disconnected during PROPFIND response")
 
-    # ─── XML / Response Helpers ────────────────────────────
+    def _propfind_rows(self, path: str, depth: str):
+        """Rendered D:response rows for path, or None if nothing is there.
 
-    def _propfind_dir_response(self, path: str) -> dict:
-        href = quote(path + '/') if path != '/' else '/'
-        return {
-            'href': href,
-            'is_dir': True,
-            'size': 0,
-            'modified': time.time()
-        }
+        Rows are rendered lazily, so a streamed reply never holds them all.
+        """
+        if path == '/':
+            # Look the snapshot up now so a failure happens before any headers
+            by_dir = self._manifest_snapshot().by_dir if depth != '0' else None
+            return self._root_rows(by_dir)
 
-    def _propfind_file_response(self, path: str, size: int, modified: float) -> dict:
-        return {
-            'href': quote(path),
-            'is_dir': False,
-            'size': size,
-            'modified': modified,
-            'content_type': self._guess_content_type(path)
-        }
+        manifest = self._cached_manifest(path)
+        if manifest:
+            return iter((self._propfind_file_response(
+                path, manifest['file_size'], manifest.get('created_at', 0)
+            ),))
+
+        manifests = self._cached_list(path, recursive=True)
+        if not manifests:
+            return None
+        return self._dir_rows(path, manifests, depth)
+
+    def _root_rows(self, by_dir):
+        yield self._propfind_dir_response('/')
+        if by_dir is None:
+            return
 
-    def _build_multistatus(self, responses: list) -> bytes:
-        lines = ['<?xml version="1.0" encoding="utf-8"?>']
-        lines.append('<D:multistatus xmlns:D="DAV:">')
+        dirs = {'/' + rd.strip('/').split('/')[0] for rd in by_dir if rd != '/'}
 
-        for resp in responses:
-            lines.append('  <D:response>')
-            lines.append(f'    <D:href>{resp["href"]}</D:href>')
-            lines.append('    <D:propstat>')
-            lines.append('      <D:prop>')
+        for d in sorted(dirs):
+            yield self._propfind_dir_response(d)
 
-            if resp['is_dir']:
-                lines.append('        <D:resourcetype><D:collection/></D:resourcetype>')
-            else:
-                lines.append('        <D:resourcetype/>')
-                lines.append(f'        <D:getcontentlength>{resp["size"]}</D:getcontentlength>')
-                ct = resp.get('content_type', 'application/octet-stream')
-                lines.append(f'        <D:getcontenttype>{ct}</D:getcontenttype>')
+        for m in by_dir.get('/', ()):
+            yield self._propfind_file_response(
+                m['file_path'], m['file_size'], m.get('created_at', 0)
+            )
+
+    def _dir_rows(self, path: str, manifests: list, depth: str):
+        yield self._propfind_dir_response(path)
+        if depth == '0':
+            return
 
-            lines.append(f'        <D:getlastmodified>{self._format_time(resp["modified"])}</D:getlastmodified>')
-            lines.append('      </D:prop>')
-            lines.append('      <D:status>HTTP/1.1 200 OK</D:status>')
-            lines.append('    </D:propstat>')
-            lines.append('  </D:response>')
+        # Find subdirectories within this directory
+        prefix = path.rstrip('/') + '/'
+        subdirs = set()
+        for m in manifests:
+            rd = m.get('remote_dir', '/')
+            # Check if this file is in a subdirectory of current path
+            if rd != path and rd.startswith(prefix):
+                # Extract the immediate subdirectory name
+                subdir_name = rd[len(prefix):].split('/')[0]
+                if subdir_name:
+                    subdirs.add(prefix + subdir_name)
 
-        lines.append('</D:multistatus>')
+        # Add subdirectory responses
+        for subdir in sorted(subdirs):
+            yield self._propfind_dir_response(subdir)
 
-        return '\n'.join(lines).encode('utf-8')
+        # Add file responses (files directly in this directory only)
+        for m in manifests:
+            if m.get('remote_dir', '/') == path:
+                yield self._propfind_file_response(
+                    m['file_path'], m['file_size'], m.get('created_at', 0)
+                )
+
+    def _send_chunks(self, chunks: list):
+        """Send chunks in order, downloading the next few while the current one is sent.
+
+        Downloads ahead run on the executor shared by all requests and only
+        while the shared prefetch budget has room; otherwise a chunk is
+        fetched on this thread when it is due.
+        """
+        config = self.pool.config
+        zero_copy = config.zero_copy_send
+        if zero_copy:
+            fetch = self.pool.backend.download_to_tempfile
+        else:
+            fetch = self.pool.backend.download_bytes
+        ahead = config.prefetch_chunks if config.enable_prefetch else 0
+        low_latency = config.low_latency_stream
+        budget = self._prefetch_budget
+
+        pending = {}  # chunk position -> (future, reserved bytes)
+        try:
+            for i, chunk in enumerate(chunks):
+                for j in range(i + 1, min(i + 1 + ahead, len(chunks))):
+                    if j in pending:
+                        continue
+                    upcoming = chunks[j]
+                    if not budget.try_acquire(upcoming['size']):
+                        break
+                    try:
+                        future = self._prefetcher.submit(fetch, upcoming['remote'], upcoming['path'])
+                    except RuntimeError:
+                        # Executor shut down: the server is stopping
+                        budget.release(upcoming['size'])
+                        break
+                    pending[j] = (future, upcoming['size'])
+
+                future, reserved = pending.pop(i, (None, 0))
+                try:
+                    data = future.result() if future is not None else fetch(chunk['remote'], chunk['path'])
+                    if data is None:
+                        log.error(f"Failed to download chunk {chunk['index']}")
+                        break
+                    self._send_chunk(data, zero_copy, low_latency)
+                finally:
+                    budget.release(reserved)
+        except (BrokenPipeError, ConnectionResetError):
+            log.debug("Client disconnected during download")
+        finally:
+            # Drop downloads nobody will send
+            for future, reserved in pending.values():
+                if future.cancel():
+                    budget.release(reserved)
+                else:
+                    future.add_done_callback(functools.partial(_discard_prefetch, budget, reserved))
+
+    def _send_chunk(self, data, zero_copy: bool, low_latency: bool):
+        if zero_copy:
+            # Let the kernel copy the chunk file straight to the socket
+            with data:
+                self.wfile.flush()
+                self.connection.sendfile(data)
+        else:
+            self.wfile.write(data)
+            if low_latency:
+                self.wfile.flush()
+
+    # ─── Manifest Lookup Cache ─────────────────────────────
+
+    def _cached_manifest(self, path: str):
+        """load_manifest_for_file, served from the TTL cache when fresh."""
+        key = self._cache_key(path)
+        manifest = self._manifest_cache.get(key, _MISSING)
+        if manifest is _MISSING:
+            manifest = self.pool.manifest_mgr.load_manifest_for_file(path)
+            self._manifest_cache.put(key, manifest)
+        return manifest
+
+    def _cached_list(self, path: str, recursive: bool = False) -> list:
+        """list_manifests, served from the TTL cache when fresh."""
+        key = (self._cache_key(path), recursive)
+        manifests = self._listing_cache.get(key)
+        if manifests is None:
+            manifests = self.pool.manifest_mgr.list_manifests(path, recursive=recursive)
+            self._listing_cache.put(key, manifests)
+        return manifests
+
+    def _manifest_snapshot(self):
+        """manifest_mgr.snapshot(), refreshed at most once per webdav_cache_ttl.
+
+        Changes made through this server drop it immediately; changes made
+        elsewhere show up within the TTL.
+        """
+        cls = type(self)
+        with cls._snapshot_lock:
+            now = time.monotonic()
+            if cls._snapshot is None or cls._snapshot[0] <= now:
+                cls._snapshot = (now + self.pool.config.webdav_cache_ttl,
+                                 self.pool.manifest_mgr.snapshot())
+            return cls._snapshot[1]
+
+    def _invalidate(self, *paths: str):
+        """Drop cached lookups after a write to any of the given paths."""
+        for path in paths:
+            self._manifest_cache.pop(self._cache_key(path))
+        type(self)._snapshot = None
+        # A change in a directory shows up in the recursive listing of every
+        # ancestor, so drop all listings rather than tracking which are affected
+        self._listing_cache.clear()
+
+    @staticmethod
+    def _cache_key(path: str) -> str:
+        return '/' + path.strip('/')
+
+    # ─── XML / Response Helpers ────────────────────────────
+
+    # Rows are rendered once here; hrefs come from quote() and need no XML escaping
+
+    def _propfind_dir_response(self, path: str) -> bytes:
+        href = quote(path + '/') if path != '/' else '/'
+        return _DIR_RESPONSE % (href.encode(), self._format_time_b(time.time()))
+
+    def _propfind_file_response(self, path: str, size: int, modified: float) -> bytes:
+        return _FILE_RESPONSE % (quote(path).encode(), size,
+                                 self._guess_content_type_b(path), self._format_time_b(modified))
+
+    def _build_multistatus(self, rows) -> bytes:
+        return _MULTISTATUS_HEAD + b''.join(rows) + _MULTISTATUS_TAIL
+
+    def _send_multistatus_streamed(self, rows):
+        """Send a 207 without Content-Length, writing rows in batches as they are generated.
+
+        The server speaks HTTP/1.0, so the body ends when the connection closes.
+        """
+        self.send_response(207)
+        self.send_header('Content-Type', 'application/xml; charset=utf-8')
+        self.send_header('Connection', 'close')
+        self.end_headers()
+        self.close_connection = True
+
+        buf = bytearray(_MULTISTATUS_HEAD)
+        for row in rows:
+            buf += row
+            if len(buf) >= _STREAM_BATCH:
+                self.wfile.write(buf)
+                buf.clear()
+        buf += _MULTISTATUS_TAIL
+        self.wfile.write(buf)
 
     def _format_time(self, timestamp: float) -> str:
         if timestamp == 0:
             timestamp = time.time()
-        return time.strftime('%a, %d %b %Y %H:%M:%S GMT', time.gmtime(timestamp))
+        return _http_date(int(timestamp))
+
+    def _format_time_b(self, timestamp: float) -> bytes:
+        if timestamp == 0:
+            timestamp = time.time()
+        return _http_date_b(int(timestamp))
 
     def _is_browser_resource(self, path: str) -> bool:
         """Check if path is a common browser resource that should return 404."""
@@ -445,110 +832,58 @@ class WebDAVHandler(BaseHTTPRequestHandler):
             log.debug(f"Client disconnected before receiving {code} error")
 
     def _guess_content_type(self, path: str) -> str:
-        ext = os.path.splitext(path)[1].lower()
-        types = {
-            '.mp4': 'video/mp4',
-            '.mkv': 'video/x-matroska',
-            '.avi': 'video/x-msvideo',
-            '.mov': 'video/quicktime',
-            '.webm': 'video/webm',
-            '.flv': 'video/x-flv',
-            '.m4v': 'video/mp4',
-            '.ts': 'video/mp2t',
-            '.mp3': 'audio/mpeg',
-            '.flac': 'audio/flac',
-            '.wav': 'audio/wav',
-            '.aac': 'audio/aac',
-            '.ogg': 'audio/ogg',
-            '.m4a': 'audio/mp4',
-            '.jpg': 'image/jpeg',
-            '.jpeg': 'image/jpeg',
-            '.png': 'image/png',
-            '.gif': 'image/gif',
-            '.webp': 'image/webp',
-            '.pdf': 'application/pdf',
-            '.zip': 'application/zip',
-            '.rar': 'application/x-rar-compressed',
-            '.7z': 'application/x-7z-compressed',
-            '.tar': 'application/x-tar',
-            '.gz': 'application/gzip',
-            '.txt': 'text/plain',
-            '.json': 'application/json',
-            '.xml': 'application/xml',
-            '.html': 'text/html',
-            '.srt': 'text/plain',
-            '.ass': 'text/plain',
-            '.sub': 'text/plain',
-            '.iso': 'application/x-iso9660-image',
-            '.img': 'application/octet-stream',
-        }
-        return types.get(ext, 'application/octet-stream')
+        _, sep, ext = path.rpartition('.')
+        if not sep:
+            return 'application/octet-stream'
+        return _CT_MAP.get('.' + ext.lower(), 'application/octet-stream')
+
+    def _guess_content_type_b(self, path: str) -> bytes:
+        """Content type as bytes, for the PROPFIND XML builder."""
+        _, sep, ext = path.rpartition('.')
+        if not sep:
+            return b'application/octet-stream'
+        return _CT_MAP_B.get('.' + ext.lower(), b'application/octet-stream')
 
     def _send_directory_listing(self, path: str):
-        manifests = self.pool.manifest_mgr.list_manifests(path, recursive=True)
+        manifests = self._cached_list(path, recursive=True)
+        base = path.rstrip('/')
 
-        html = f"""<!DOCTYPE html>
-<html>
-<head><title>rclonepool — {path}</title>
-<style>
-    body {{ font-family: monospace; padding: 20px; background: #1a1a2e; color: #eee; }}
-    a {{ color: #4fc3f7; text-decoration: none; }}
-    a:hover {{ text-decoration: underline; }}
-    table {{ border-collapse: collapse; width: 100%; }}
-    th, td {{ text-align: left; padding: 8px 16px; border-bottom: 1px solid #333; }}
-    th {{ color: #aaa; }}
-    .size {{ text-align: right; }}
-    h2 {{ color: #4fc3f7; }}
-    .dir {{ color: #ffd700; }}
-</style>
-</head>
-<body>
-<h2>📦 rclonepool — {path}</h2>
-<table>
-<tr><th>Name</th><th class="size">Size</th><th>Chunks</th><th>Remotes</th></tr>
-"""
+        parts = [_HTML_HEAD % {'path': html.escape(path)}]
         if path != '/':
-            parent = '/'.join(path.rstrip('/').split('/')[:-1]) or '/'
-            html += f'<tr><td><a href="{quote(parent)}">⬆️ ..</a></td><td></td><td></td><td></td></tr>\n'
+            parent = '/'.join(base.split('/')[:-1]) or '/'
+            parts.append(_PARENT_ROW.format(href=quote(parent)))
 
         # Find subdirectories
         subdirs = set()
         for m in manifests:
             rd = m.get('remote_dir', '/')
-            if rd != path and rd.startswith(path.rstrip('/') + '/'):
-                remaining = rd[len(path.rstrip('/') + '/'):]
+            if rd != path and rd.startswith(base + '/'):
+                remaining = rd[len(base + '/'):]
                 subdir_name = remaining.split('/')[0]
                 if subdir_name:
                     subdirs.add(subdir_name)
-        
+
         # Add subdirectories
         for subdir in sorted(subdirs):
-            subdir_path = path.rstrip('/') + '/' + subdir
-            html += (f'<tr>'
-                     f'<td class="dir"><a href="{quote(subdir_path)}">📁 {subdir}/</a></td>'
-                     f'<td class="size">—</td>'
-                     f'<td>—</td>'
-                     f'<td>—</td>'
-                     f'</tr>\n')
+            parts.append(_DIR_ROW.format(href=quote(base + '/' + subdir), name=html.escape(subdir)))
 
         # Add files (only in current directory)
         for m in manifests:
             if m.get('remote_dir', '/') == path:
-                size_str = self._human_size(m['file_size'])
-                remotes_used = ', '.join(sorted(set(c['remote'] for c in m['chunks'])))
-                html += (f'<tr>'
-                         f'<td><a href="{quote(m["file_path"])}">{m["file_name"]}</a></td>'
-                         f'<td class="size">{size_str}</td>'
-                         f'<td>{len(m["chunks"])}</td>'
-                         f'<td>{remotes_used}</td>'
-                         f'</tr>\n')
-
-        html += """</table>
-<hr>
-<p>rclonepool WebDAV server · <a href="/">home</a></p>
-</body></html>"""
+                remotes_used = set()
+                for c in m['chunks']:
+                    remotes_used.add(c['remote'])
+                parts.append(_FILE_ROW.format(
+                    href=quote(m['file_path']),
+                    name=html.escape(m['file_name']),
+                    size=self._human_size(m['file_size']),
+                    chunks=len(m['chunks']),
+                    remotes=html.escape(', '.join(sorted(remotes_used)))
+                ))
+
+        parts.append(_HTML_FOOT)
 
-        data = html.encode('utf-8')
+        data = ''.join(parts).encode('utf-8')
         self.send_response(200)
         self.send_header('Content-Type', 'text/html; charset=utf-8')
         self.send_header('Content-Length', str(len(data)))
@@ -556,6 +891,7 @@ class WebDAVHandler(BaseHTTPRequestHandler):
         self.wfile.write(data)
 
     @staticmethod
+    @functools.lru_cache(maxsize=4096)
     def _human_size(size: int) -> str:
         for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
             if size < 1024:
@@ -575,15 +911,17 @@ class RclonePoolDAVServer:
 
     def run(self):
         """Start the WebDAV server (blocking)."""
-        # Set the pool reference on the handler class
-        WebDAVHandler.pool = self.pool
+        # Set the pool reference and lookup caches on the handler class
+        WebDAVHandler.configure(self.pool)
 
-        self.server = ThreadedHTTPServer((self.host, self.port), WebDAVHandler)
+        self.server = ThreadedHTTPServer((self.host, self.port), WebDAVHandler,
+                                         max_workers=self.pool.config.webdav_workers)
 
-        # Graceful shutdown on SIGINT/SIGTERM
+        # Graceful shutdown on SIGINT/SIGTERM; serve_forever runs on this
+        # thread, so flag it instead of calling shutdown()
         def shutdown_handler(signum, frame):
             log.info("\nShutting down WebDAV server...")
-            threading.Thread(target=self.server.shutdown).start()
+            self.server.request_shutdown()
 
         signal.signal(signal.SIGINT, shutdown_handler)
         signal.signal(signal.SIGTERM, shutdown_handler)
@@ -592,11 +930,12 @@ class RclonePoolDAVServer:
         log.info(f"Press Ctrl+C to stop\n")
 
         try:
-            self.server.serve_forever()
-        except KeyboardInterrupt:
+            self.server.serve_forever(poll_interval=_POLL_INTERVAL)
+        except (KeyboardInterrupt, StopServing):
             pass
         finally:
             self.server.server_close()
+            WebDAVHandler.close()
             log.info("WebDAV server stopped")
 
     def stop(self):